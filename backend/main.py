@@ -120,5 +120,4 @@ def api():
 
 paths = ['_temp', '_samples', '_segments', '_speech_profiles']
 for path in paths:
-    if not os.path.exists(path):
-        os.makedirs(path)
\ No newline at end of file
+    os.makedirs(path, exist_ok=True)
\ No newline at end of file
@@ -121,5 +121,4 @@
 
   paths = ['_temp', '_samples', '_segments', '_speech_profiles']
   for path in paths:
-      if not os.path.exists(path):
-          os.makedirs(path)
+      os.makedirs(path, exist_ok=True)
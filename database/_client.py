@@ -1,50 +1,90 @@
+import functools
 import hashlib
 import json
 import os
+import threading
 import uuid
+from typing import List
 
-# If Supabase is configured, use the Supabase adapter and avoid Firebase entirely
-if os.getenv('SUPABASE_URL') and os.getenv('SUPABASE_ANON_KEY'):
-    from database.supabase_client import db  # type: ignore
-else:
+from cachetools import TTLCache, cached
+
+
+def _use_supabase() -> bool:
+    return bool(os.getenv('SUPABASE_URL') and os.getenv('SUPABASE_ANON_KEY'))
+
+
+def _service_account_info():
+    if not os.environ.get('SERVICE_ACCOUNT_JSON'):
+        return None
+    try:
+        return json.loads(os.environ.get("SERVICE_ACCOUNT_JSON", ""))
+    except Exception:
+        # Fallback to default client if env var is set but invalid
+        return None
+
+
+def init_firebase():
+    """Initializes the default Firebase app once and returns the service account it was built from, if any"""
     # IMPORTANT: Ensure credentials are set up before any Google Cloud imports
-    import setup_credentials  # noqa: F401
+    import setup_credentials
 
-    from google.cloud import firestore
     import firebase_admin
     from firebase_admin import credentials
 
-    if os.environ.get('SERVICE_ACCOUNT_JSON'):
-        service_account_raw = os.environ.get("SERVICE_ACCOUNT_JSON", "")
-        try:
-            service_account_info = json.loads(service_account_raw)
-        except Exception:
-            service_account_info = None
-
+    service_account_info = setup_credentials.SERVICE_ACCOUNT_INFO or _service_account_info()
+    if not firebase_admin._apps:
         if service_account_info:
-            if not firebase_admin._apps:
-                cred = credentials.Certificate(service_account_info)
-                firebase_admin.initialize_app(cred)
-            db = firestore.Client.from_service_account_info(service_account_info)
+            firebase_admin.initialize_app(credentials.Certificate(service_account_info))
         else:
-            # Fallback to default client if env var is set but invalid
-            if not firebase_admin._apps:
-                firebase_admin.initialize_app()
-            db = firestore.Client()
-    else:
-        # Default Firestore client
-        if not firebase_admin._apps:
             firebase_admin.initialize_app()
-        db = firestore.Client()
+    return service_account_info
+
+
+@functools.cache
+def _build_db():
+    # If Supabase is configured, use the Supabase adapter and avoid Firebase entirely
+    if _use_supabase():
+        from database.supabase_client import db as supabase_db  # type: ignore
+
+        return supabase_db
+
+    service_account_info = init_firebase()
+
+    from google.cloud import firestore
+
+    database = os.getenv('FIRESTORE_DB', '(default)')
+    if service_account_info:
+        return firestore.Client.from_service_account_info(service_account_info, database=database)
+
+    # Default Firestore client
+    return firestore.Client(database=database)
+
+
+db = _build_db()
 
 
+# Streaming the users collection is O(N) reads; callers that sweep all users share one listing per minute.
+# Use get_users_uid.cache_clear() to force a refresh.
+_users_uid_cache = TTLCache(maxsize=1, ttl=60)
+
+
+@cached(_users_uid_cache, lock=threading.Lock())
 def get_users_uid():
     users_ref = db.collection('users')
     return [str(doc.id) for doc in users_ref.stream()]
 
 
+_sha256 = hashlib.sha256
+_UUID = uuid.UUID
+
+
 def document_id_from_seed(seed: str) -> uuid.UUID:
     """Avoid repeating the same data"""
-    seed_hash = hashlib.sha256(seed.encode('utf-8')).digest()
-    generated_uuid = uuid.UUID(bytes=seed_hash[:16], version=4)
+    seed_hash = _sha256(seed.encode('utf-8')).digest()
+    generated_uuid = _UUID(bytes=seed_hash[:16], version=4)
     return str(generated_uuid)
+
+
+def document_ids_from_seeds(seeds: List[str]) -> List[str]:
+    """Batch variant of document_id_from_seed, same ids in the same order"""
+    return [str(_UUID(bytes=_sha256(seed.encode('utf-8')).digest()[:16], version=4)) for seed in seeds]
@@ -1,61 +1,151 @@
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 import uuid
 from typing import Optional, List, Dict, Any
+from google.api_core.exceptions import FailedPrecondition, NotFound
 from google.cloud import firestore
-from google.cloud.firestore_v1 import FieldFilter
-import os
+from google.cloud.firestore_v1 import And, FieldFilter, Or
 
-from ._client import db
-from database.supabase_client import supabase
+from postgrest.types import CountMethod
+
+from ._client import _use_supabase, db
+from database.supabase_client import execute_with_reconnect, get_supabase, returning_ids
 
 
 # Collection name
 action_items_collection = 'action_items'
 
+# Backend selection is fixed for the lifetime of the process
+_USE_SUPABASE = _use_supabase()
 
-def _prepare_action_item_for_write(action_item_data: dict) -> dict:
-    """Prepare action item data for writing to database"""
-    # Ensure timestamps are properly formatted
-    if 'created_at' in action_item_data and action_item_data['created_at']:
-        if isinstance(action_item_data['created_at'], str):
-            action_item_data['created_at'] = datetime.fromisoformat(
-                action_item_data['created_at'].replace('Z', '+00:00')
-            )
+# Firestore write batches are capped at 500 operations; smaller chunks committed concurrently finish sooner
+_WRITE_BATCH_SIZE = 250
+_UNLOCK_BATCH_SIZE = 450
+_BATCH_COMMIT_WORKERS = 8
 
-    if 'updated_at' in action_item_data and action_item_data['updated_at']:
-        if isinstance(action_item_data['updated_at'], str):
-            action_item_data['updated_at'] = datetime.fromisoformat(
-                action_item_data['updated_at'].replace('Z', '+00:00')
-            )
 
-    if 'due_at' in action_item_data and action_item_data['due_at']:
-        if isinstance(action_item_data['due_at'], str):
-            action_item_data['due_at'] = datetime.fromisoformat(action_item_data['due_at'].replace('Z', '+00:00'))
+def _commit_in_chunks(items: list, chunk_size: int, apply):
+    """Commit items in write batches of chunk_size, calling apply(batch, item) for each; batches run in parallel."""
+    chunks = [items[i : i + chunk_size] for i in range(0, len(items), chunk_size)]
 
-    if 'completed_at' in action_item_data and action_item_data['completed_at']:
-        if isinstance(action_item_data['completed_at'], str):
-            action_item_data['completed_at'] = datetime.fromisoformat(
-                action_item_data['completed_at'].replace('Z', '+00:00')
-            )
+    def _commit(chunk):
+        batch = db.batch()
+        for item in chunk:
+            apply(batch, item)
+        batch.commit()
+
+    if len(chunks) == 1:
+        _commit(chunks[0])
+        return
+
+    with ThreadPoolExecutor(max_workers=_BATCH_COMMIT_WORKERS) as executor:
+        list(executor.map(_commit, chunks))
+
+
+_DATE_FIELDS = ('created_at', 'updated_at', 'due_at', 'completed_at')
+_MAX_UTC = datetime.max.replace(tzinfo=timezone.utc)
+_MIN_UTC = datetime.min.replace(tzinfo=timezone.utc)
 
+
+@functools.lru_cache(maxsize=1 << 15)
+def _parse_iso(value: str) -> datetime:
+    # Batches share created_at/updated_at strings, so repeated timestamps are parsed once
+    return datetime.fromisoformat(value[:-1] + '+00:00' if value.endswith('Z') else value)
+
+
+def _prepare_action_item_for_write(action_item_data: dict) -> dict:
+    """Prepare action item data for writing to database"""
+    # Ensure timestamps are properly formatted
+    for field in _DATE_FIELDS:
+        v = action_item_data.get(field)
+        if v and isinstance(v, str):
+            action_item_data[field] = _parse_iso(v)
     return action_item_data
 
 
 def _prepare_action_item_for_read(action_item_data: dict) -> dict:
     """Prepare action item data for reading from database"""
-    for field in ['created_at', 'updated_at', 'due_at', 'completed_at']:
-        if field in action_item_data and action_item_data[field]:
-            v = action_item_data[field]
-            if hasattr(v, 'timestamp'):
-                action_item_data[field] = datetime.fromtimestamp(v.timestamp(), tz=timezone.utc)
-            elif isinstance(v, str):
-                try:
-                    action_item_data[field] = datetime.fromisoformat(v.replace('Z', '+00:00'))
-                except Exception:
-                    pass
+    for field in _DATE_FIELDS:
+        v = action_item_data.get(field)
+        if not v:
+            continue
+        # Firestore returns DatetimeWithNanoseconds, a datetime subclass
+        if isinstance(v, datetime):
+            action_item_data[field] = datetime.fromtimestamp(v.timestamp(), tz=timezone.utc)
+        elif isinstance(v, str):
+            try:
+                action_item_data[field] = _parse_iso(v)
+            except Exception:
+                pass
     return action_item_data
 
 
+def _prepare_action_item_for_supabase(action_item_data: dict, uid: str, now: datetime) -> dict:
+    """Build a Supabase row from action item data, filling default timestamps, id and uid"""
+    data = action_item_data.copy()
+    data.setdefault('created_at', now)
+    data.setdefault('updated_at', now)
+    if data.get('completed', False) and not data.get('completed_at'):
+        data['completed_at'] = now
+    # Datetimes are left in place; the Supabase session serializes them with orjson
+    data.setdefault('id', str(uuid.uuid4()))
+    data['uid'] = uid
+    return data
+
+
+def _supabase_date_range(field: str, start_date: Optional[datetime], end_date: Optional[datetime]) -> str:
+    """PostgREST filter expression for start_date <= field <= end_date; either bound may be open"""
+    bounds = []
+    if start_date is not None:
+        bounds.append(f'{field}.gte."{start_date.isoformat()}"')
+    if end_date is not None:
+        bounds.append(f'{field}.lte."{end_date.isoformat()}"')
+    return bounds[0] if len(bounds) == 1 else f'and({",".join(bounds)})'
+
+
+def _firestore_date_range(field: str, start_date: Optional[datetime], end_date: Optional[datetime]):
+    """Firestore filter for start_date <= field <= end_date; either bound may be open"""
+    bounds = []
+    if start_date is not None:
+        bounds.append(FieldFilter(field, '>=', start_date))
+    if end_date is not None:
+        bounds.append(FieldFilter(field, '<=', end_date))
+    return bounds[0] if len(bounds) == 1 else And(bounds)
+
+
+def _supabase_columns(fields: Optional[List[str]]) -> str:
+    if not fields:
+        return '*'
+    return ','.join(dict.fromkeys(['id', *fields]))
+
+
+def _action_item_exists(uid: str, action_item_id: str) -> bool:
+    """Cheap existence check that reads only the id"""
+    if _USE_SUPABASE:
+        res = execute_with_reconnect(
+            get_supabase().table('action_items').select('id').eq('uid', uid).eq('id', action_item_id).limit(1),
+            idempotent=True,
+        )
+        return bool(res and getattr(res, 'data', None))
+
+    doc = db.collection('users').document(uid).collection(action_items_collection).document(action_item_id).get(
+        field_paths=[]
+    )
+    return doc.exists
+
+
+def _action_item_sort_key(item: dict):
+    """Items with a due date first, soonest due first, then newest created first"""
+    due_at = item.get('due_at')
+    return due_at is None, due_at or _MAX_UTC, -(item.get('created_at', _MIN_UTC).timestamp())
+
+
+def _sort_action_items(items: List[dict]) -> List[dict]:
+    items.sort(key=_action_item_sort_key)
+    return items
+
+
 # *****************************
 # ********** CREATE ***********
 # *****************************
@@ -72,24 +162,10 @@ def create_action_item(uid: str, action_item_data: dict) -> str:
     Returns:
         The ID of the created action item
     """
-    action_item_data = _prepare_action_item_for_write(action_item_data)
-
-    if os.getenv('SUPABASE_URL') and os.getenv('SUPABASE_ANON_KEY'):
-        data = _prepare_action_item_for_write(action_item_data.copy())
-        now_iso = datetime.now(timezone.utc).isoformat()
-        data.setdefault('created_at', now_iso)
-        data.setdefault('updated_at', now_iso)
-        if data.get('completed', False) and not data.get('completed_at'):
-            data['completed_at'] = now_iso
-        # Convert datetimes to ISO strings
-        for k in ['created_at', 'updated_at', 'due_at', 'completed_at']:
-            v = data.get(k)
-            if hasattr(v, 'isoformat'):
-                data[k] = v.isoformat()
-        data.setdefault('id', str(uuid.uuid4()))
-        data['uid'] = uid
+    if _USE_SUPABASE:
+        data = _prepare_action_item_for_supabase(action_item_data, uid, datetime.now(timezone.utc))
         try:
-            res = supabase.table('action_items').insert(data).execute()
+            res = execute_with_reconnect(get_supabase().table('action_items').insert(data))
         except Exception as e:
             raise Exception(f"Supabase insert exception: {str(e)}; data={data}")
         if not res or not getattr(res, 'data', None):
@@ -98,17 +174,20 @@ def create_action_item(uid: str, action_item_data: dict) -> str:
             raise Exception(f"Supabase insert failed for action_items: error={err}; data={data}")
         return res.data[0].get('id')
 
+    action_item_data = _prepare_action_item_for_write(action_item_data)
+
     user_ref = db.collection('users').document(uid)
     action_items_ref = user_ref.collection(action_items_collection)
 
+    now = datetime.now(timezone.utc)
     if 'created_at' not in action_item_data:
-        action_item_data['created_at'] = datetime.now(timezone.utc)
+        action_item_data['created_at'] = now
     if 'updated_at' not in action_item_data:
-        action_item_data['updated_at'] = datetime.now(timezone.utc)
+        action_item_data['updated_at'] = now
 
     # Set completed_at if the item is being created as completed
     if action_item_data.get('completed', False) and 'completed_at' not in action_item_data:
-        action_item_data['completed_at'] = datetime.now(timezone.utc)
+        action_item_data['completed_at'] = now
 
     doc_ref = action_items_ref.add(action_item_data)[1]
 
@@ -129,23 +208,10 @@ def create_action_items_batch(uid: str, action_items_data: List[dict]) -> List[s
     if not action_items_data:
         return []
 
-    if os.getenv('SUPABASE_URL') and os.getenv('SUPABASE_ANON_KEY'):
-        now_iso = datetime.now(timezone.utc).isoformat()
-        rows = []
-        for item in action_items_data:
-            data = _prepare_action_item_for_write(item.copy())
-            data.setdefault('created_at', now_iso)
-            data.setdefault('updated_at', now_iso)
-            if data.get('completed', False) and not data.get('completed_at'):
-                data['completed_at'] = now_iso
-            for k in ['created_at', 'updated_at', 'due_at', 'completed_at']:
-                v = data.get(k)
-                if hasattr(v, 'isoformat'):
-                    data[k] = v.isoformat()
-            data.setdefault('id', str(uuid.uuid4()))
-            data['uid'] = uid
-            rows.append(data)
-        res = supabase.table('action_items').insert(rows).execute()
+    if _USE_SUPABASE:
+        now = datetime.now(timezone.utc)
+        rows = [_prepare_action_item_for_supabase(item, uid, now) for item in action_items_data]
+        res = execute_with_reconnect(get_supabase().table('action_items').insert(rows))
         if not res or not getattr(res, 'data', None):
             raise Exception(f"Supabase batch insert failed for action_items: {getattr(res, 'error', None) or res}")
         return [r.get('id') for r in (res.data or [])]
@@ -153,29 +219,26 @@ def create_action_items_batch(uid: str, action_items_data: List[dict]) -> List[s
     user_ref = db.collection('users').document(uid)
     action_items_ref = user_ref.collection(action_items_collection)
 
-    batch = db.batch()
-    doc_refs = []
+    writes = []
+    now = datetime.now(timezone.utc)
 
     for action_item_data in action_items_data:
         action_item_data = _prepare_action_item_for_write(action_item_data)
 
         if 'created_at' not in action_item_data:
-            action_item_data['created_at'] = datetime.now(timezone.utc)
+            action_item_data['created_at'] = now
         if 'updated_at' not in action_item_data:
-            action_item_data['updated_at'] = datetime.now(timezone.utc)
+            action_item_data['updated_at'] = now
 
         # Set completed_at if the item is being created as completed
         if action_item_data.get('completed', False) and 'completed_at' not in action_item_data:
-            action_item_data['completed_at'] = datetime.now(timezone.utc)
+            action_item_data['completed_at'] = now
 
-        doc_ref = action_items_ref.document()
-        batch.set(doc_ref, action_item_data)
-        doc_refs.append(doc_ref.id)
+        writes.append((action_items_ref.document(), action_item_data))
 
-    # Commit batch
-    batch.commit()
+    _commit_in_chunks(writes, _WRITE_BATCH_SIZE, lambda batch, write: batch.set(*write))
 
-    return doc_refs
+    return [doc_ref.id for doc_ref, _ in writes]
 
 
 # *****************************
@@ -194,8 +257,11 @@ def get_action_item(uid: str, action_item_id: str) -> Optional[dict]:
     Returns:
         Action item data or None if not found
     """
-    if os.getenv('SUPABASE_URL') and os.getenv('SUPABASE_ANON_KEY'):
-        res = supabase.table('action_items').select('*').eq('uid', uid).eq('id', action_item_id).single().execute()
+    if _USE_SUPABASE:
+        res = execute_with_reconnect(
+            get_supabase().table('action_items').select('*').eq('uid', uid).eq('id', action_item_id).single(),
+            idempotent=True,
+        )
         if not res or not getattr(res, 'data', None):
             return None
         data = res.data
@@ -221,6 +287,7 @@ def get_action_items(
     end_date: Optional[datetime] = None,
     limit: Optional[int] = None,
     offset: int = 0,
+    fields: Optional[List[str]] = None,
 ) -> List[dict]:
     """
     Get action items for a user with optional filters.
@@ -233,19 +300,26 @@ def get_action_items(
         end_date: Filter by end date (inclusive)
         limit: Maximum number of items to return
         offset: Number of items to skip
+        fields: Only fetch these fields (the ID is always included)
 
     Returns:
         List of action items
     """
-    if os.getenv('SUPABASE_URL') and os.getenv('SUPABASE_ANON_KEY'):
+    if _USE_SUPABASE:
         try:
-            q = supabase.table('action_items').select('*').eq('uid', uid)
+            q = get_supabase().table('action_items').select(_supabase_columns(fields)).eq('uid', uid)
         except Exception as e:
             raise Exception(f"Supabase select builder error: {str(e)}")
         if conversation_id is not None:
             q = q.eq('conversation_id', conversation_id)
         if completed is not None:
             q = q.eq('completed', completed)
+        if start_date is not None or end_date is not None:
+            # Keep items whose created_at or due_at falls within the range
+            q = q.or_(
+                f'{_supabase_date_range("created_at", start_date, end_date)},'
+                f'{_supabase_date_range("due_at", start_date, end_date)}'
+            )
         try:
             q = q.order('created_at', desc=True)
         except Exception as e:
@@ -256,37 +330,14 @@ def get_action_items(
         except Exception:
             pass
         try:
-            res = q.execute()
+            res = execute_with_reconnect(q, idempotent=True)
         except Exception as e:
             raise Exception(f"Supabase execute error: {str(e)}")
-        items = []
         rows = res.data or []
         if not isinstance(rows, list):
             raise Exception(f"Supabase returned non-list data: {type(rows)} {rows}")
-        for data in rows:
-            ai = _prepare_action_item_for_read(data)
-            # Manual date filters if provided
-            if start_date is not None or end_date is not None:
-                created_at = ai.get('created_at')
-                due_at = ai.get('due_at')
-                in_range = False
-                if created_at is not None:
-                    if (start_date is None or created_at >= start_date) and (end_date is None or created_at <= end_date):
-                        in_range = True
-                if not in_range and due_at is not None:
-                    if (start_date is None or due_at >= start_date) and (end_date is None or due_at <= end_date):
-                        in_range = True
-                if not in_range:
-                    continue
-            items.append(ai)
-        items.sort(
-            key=lambda x: (
-                x.get('due_at') is None,
-                x.get('due_at') or datetime.max.replace(tzinfo=timezone.utc),
-                -(x.get('created_at', datetime.min.replace(tzinfo=timezone.utc)).timestamp()),
-            )
-        )
-        return items
+        items = [_prepare_action_item_for_read(data) for data in rows]
+        return _sort_action_items(items)
 
     user_ref = db.collection('users').document(uid)
     query = user_ref.collection(action_items_collection)
@@ -300,6 +351,20 @@ def get_action_items(
     if completed is not None:
         query = query.where(filter=FieldFilter('completed', '==', completed))
 
+    # Keep items whose created_at or due_at falls within the date range
+    if start_date is not None or end_date is not None:
+        query = query.where(
+            filter=Or(
+                [
+                    _firestore_date_range('created_at', start_date, end_date),
+                    _firestore_date_range('due_at', start_date, end_date),
+                ]
+            )
+        )
+
+    if fields:
+        query = query.select(fields)
+
     # Order by created date
     query = query.order_by('created_at', direction=firestore.Query.DESCENDING)
 
@@ -316,61 +381,52 @@ def get_action_items(
     for doc in docs:
         data = doc.to_dict()
         data['id'] = doc.id
-        action_item = _prepare_action_item_for_read(data)
-
-        # Apply date range filter in memory if needed
-        if start_date is not None or end_date is not None:
-            created_at = action_item.get('created_at')
-            due_at = action_item.get('due_at')
-
-            # Check if either created_at or due_at falls within the date range
-            date_in_range = False
-
-            if created_at is not None:
-                if start_date is not None and created_at < start_date:
-                    pass  # created_at is before start_date
-                elif end_date is not None and created_at > end_date:
-                    pass  # created_at is after end_date
-                else:
-                    date_in_range = True
-
-            if not date_in_range and due_at is not None:
-                if start_date is not None and due_at < start_date:
-                    pass  # due_at is before start_date
-                elif end_date is not None and due_at > end_date:
-                    pass  # due_at is after end_date
-                else:
-                    date_in_range = True
-
-            # If we have date filters but no dates fall in range, skip this item
-            if not date_in_range:
-                continue
-
-        action_items.append(action_item)
-
-    action_items.sort(
-        key=lambda x: (
-            x.get('due_at') is None,
-            x.get('due_at') or datetime.max.replace(tzinfo=timezone.utc),
-            -(x.get('created_at', datetime.min.replace(tzinfo=timezone.utc)).timestamp()),
-        )
-    )
+        action_items.append(_prepare_action_item_for_read(data))
 
-    return action_items
+    return _sort_action_items(action_items)
 
 
-def get_action_items_by_conversation(uid: str, conversation_id: str) -> List[dict]:
+def get_action_items_by_conversation(uid: str, conversation_id: str, fields: Optional[List[str]] = None) -> List[dict]:
     """
     Get all action items for a specific conversation.
 
     Args:
         uid: User ID
         conversation_id: Conversation ID
+        fields: Only fetch these fields (the ID is always included)
 
     Returns:
         List of action items for the conversation
     """
-    return get_action_items(uid, conversation_id=conversation_id)
+    if _USE_SUPABASE:
+        res = execute_with_reconnect(
+            get_supabase()
+            .table('action_items')
+            .select(_supabase_columns(fields))
+            .eq('uid', uid)
+            .eq('conversation_id', conversation_id)
+            .order('created_at', desc=True),
+            idempotent=True,
+        )
+        items = [_prepare_action_item_for_read(data) for data in res.data or []]
+    else:
+        query = (
+            db.collection('users')
+            .document(uid)
+            .collection(action_items_collection)
+            .where(filter=FieldFilter('conversation_id', '==', conversation_id))
+            .order_by('created_at', direction=firestore.Query.DESCENDING)
+        )
+        if fields:
+            query = query.select(fields)
+        items = []
+        for doc in query.stream():
+            data = doc.to_dict()
+            data['id'] = doc.id
+            items.append(_prepare_action_item_for_read(data))
+
+    # A conversation only has a handful of items; keep the same order as get_action_items
+    return _sort_action_items(items)
 
 
 # *****************************
@@ -390,31 +446,33 @@ def update_action_item(uid: str, action_item_id: str, update_data: dict) -> bool
     Returns:
         True if updated successfully, False otherwise
     """
+    # Nothing to change beyond the timestamp; skip the write but still report a missing item
+    if not any(k != 'updated_at' for k in update_data):
+        return _action_item_exists(uid, action_item_id)
+
+    if _USE_SUPABASE:
+        update = update_data.copy()
+        update['updated_at'] = datetime.now(timezone.utc)
+        res = execute_with_reconnect(
+            get_supabase().table('action_items').update(update).eq('uid', uid).eq('id', action_item_id),
+            idempotent=True,
+        )
+        return bool(res and getattr(res, 'data', None))
+
     # Prepare data
     update_data = _prepare_action_item_for_write(update_data)
 
-    if os.getenv('SUPABASE_URL') and os.getenv('SUPABASE_ANON_KEY'):
-        update = _prepare_action_item_for_write(update_data.copy())
-        update['updated_at'] = datetime.now(timezone.utc).isoformat()
-        for k in ['updated_at', 'due_at', 'completed_at']:
-            v = update.get(k)
-            if hasattr(v, 'isoformat'):
-                update[k] = v.isoformat()
-        res = supabase.table('action_items').update(update).eq('uid', uid).eq('id', action_item_id).execute()
-        return bool(res and getattr(res, 'data', None))
-
     user_ref = db.collection('users').document(uid)
     action_item_ref = user_ref.collection(action_items_collection).document(action_item_id)
 
-    # Check if exists
-    if not action_item_ref.get().exists:
-        return False
-
     # Add updated timestamp
     update_data['updated_at'] = datetime.now(timezone.utc)
 
-    # Update the document
-    action_item_ref.update(update_data)
+    # Update requires the document to exist, so a missing item fails in the same round trip
+    try:
+        action_item_ref.update(update_data)
+    except (NotFound, FailedPrecondition):
+        return False
 
     return True
 
@@ -431,8 +489,71 @@ def mark_action_item_completed(uid: str, action_item_id: str, completed: bool =
     Returns:
         True if updated successfully, False otherwise
     """
-    update_data = {'completed': completed, 'completed_at': datetime.now(timezone.utc) if completed else None}
-    return update_action_item(uid, action_item_id, update_data)
+    now = datetime.now(timezone.utc)
+    update_data = {'completed': completed, 'completed_at': now if completed else None, 'updated_at': now}
+
+    if _USE_SUPABASE:
+        res = execute_with_reconnect(
+            get_supabase().table('action_items').update(update_data).eq('uid', uid).eq('id', action_item_id),
+            idempotent=True,
+        )
+        return bool(res and getattr(res, 'data', None))
+
+    action_item_ref = db.collection('users').document(uid).collection(action_items_collection).document(action_item_id)
+    try:
+        action_item_ref.update(update_data)
+    except (NotFound, FailedPrecondition):
+        return False
+    return True
+
+
+def bulk_update_action_items(uid: str, updates: Dict[str, dict]) -> int:
+    """
+    Update several action items in as few round trips as possible.
+
+    Args:
+        uid: User ID
+        updates: Mapping of action item ID to the fields to update
+
+    Returns:
+        Number of action items updated
+    """
+    updates = {action_item_id: fields for action_item_id, fields in updates.items() if fields}
+    if not updates:
+        return 0
+
+    now = datetime.now(timezone.utc)
+
+    if _USE_SUPABASE:
+        # PostgREST applies one payload per request, so ids sharing the same update go together
+        groups: List[tuple] = []
+        for action_item_id, update_data in updates.items():
+            for payload, ids in groups:
+                if payload == update_data:
+                    ids.append(action_item_id)
+                    break
+            else:
+                groups.append((update_data, [action_item_id]))
+
+        count = 0
+        for payload, ids in groups:
+            update = {**payload, 'updated_at': now}
+            res = execute_with_reconnect(
+                get_supabase().table('action_items').update(update).eq('uid', uid).in_('id', ids), idempotent=True
+            )
+            count += len(res.data or [])
+        return count
+
+    action_items_ref = db.collection('users').document(uid).collection(action_items_collection)
+    refs = [action_items_ref.document(action_item_id) for action_item_id in updates]
+    writes = [
+        (snap.reference, {**_prepare_action_item_for_write(dict(updates[snap.id])), 'updated_at': now})
+        for snap in db.get_all(refs)
+        if snap.exists
+    ]
+    if writes:
+        _commit_in_chunks(writes, _WRITE_BATCH_SIZE, lambda batch, write: batch.update(*write))
+    return len(writes)
 
 
 # *****************************
@@ -451,23 +572,57 @@ def delete_action_item(uid: str, action_item_id: str) -> bool:
     Returns:
         True if deleted successfully, False otherwise
     """
-    if os.getenv('SUPABASE_URL') and os.getenv('SUPABASE_ANON_KEY'):
-        res = supabase.table('action_items').delete().eq('uid', uid).eq('id', action_item_id).execute()
+    if _USE_SUPABASE:
+        res = execute_with_reconnect(
+            get_supabase().table('action_items').delete().eq('uid', uid).eq('id', action_item_id)
+        )
         return bool(res and getattr(res, 'data', None))
 
     user_ref = db.collection('users').document(uid)
     action_item_ref = user_ref.collection(action_items_collection).document(action_item_id)
 
-    # Check if exists
-    if not action_item_ref.get().exists:
+    # Delete only if the document exists, without a separate read
+    try:
+        action_item_ref.delete(option=db.write_option(exists=True))
+    except (NotFound, FailedPrecondition):
         return False
 
-    # Delete the document
-    action_item_ref.delete()
-
     return True
 
 
+def bulk_delete_action_items(uid: str, action_item_ids: List[str]) -> int:
+    """
+    Delete several action items in as few round trips as possible.
+
+    Args:
+        uid: User ID
+        action_item_ids: Action item IDs
+
+    Returns:
+        Number of deleted items
+    """
+    if not action_item_ids:
+        return 0
+
+    if _USE_SUPABASE:
+        query = (
+            get_supabase()
+            .table('action_items')
+            .delete(count=CountMethod.exact)
+            .eq('uid', uid)
+            .in_('id', action_item_ids)
+        )
+        res = execute_with_reconnect(returning_ids(query))
+        return res.count if res.count is not None else len(res.data or [])
+
+    action_items_ref = db.collection('users').document(uid).collection(action_items_collection)
+    refs = [action_items_ref.document(action_item_id) for action_item_id in action_item_ids]
+    existing = [snap.reference for snap in db.get_all(refs) if snap.exists]
+    if existing:
+        _commit_in_chunks(existing, _WRITE_BATCH_SIZE, lambda batch, ref: batch.delete(ref))
+    return len(existing)
+
+
 def delete_action_items_for_conversation(uid: str, conversation_id: str) -> int:
     """
     Delete all action items for a specific conversation.
@@ -479,14 +634,22 @@ def delete_action_items_for_conversation(uid: str, conversation_id: str) -> int:
     Returns:
         Number of deleted items
     """
-    if os.getenv('SUPABASE_URL') and os.getenv('SUPABASE_ANON_KEY'):
-        res = supabase.table('action_items').delete().eq('uid', uid).eq('conversation_id', conversation_id).execute()
-        # supabase returns deleted rows
-        return len(res.data or [])
+    if _USE_SUPABASE:
+        query = (
+            get_supabase()
+            .table('action_items')
+            .delete(count=CountMethod.exact)
+            .eq('uid', uid)
+            .eq('conversation_id', conversation_id)
+        )
+        res = execute_with_reconnect(returning_ids(query))
+        return res.count if res.count is not None else len(res.data or [])
 
     user_ref = db.collection('users').document(uid)
-    query = user_ref.collection(action_items_collection).where(
-        filter=FieldFilter('conversation_id', '==', conversation_id)
+    query = (
+        user_ref.collection(action_items_collection)
+        .where(filter=FieldFilter('conversation_id', '==', conversation_id))
+        .select([])
     )
 
     docs = query.stream()
@@ -507,24 +670,19 @@ def unlock_all_action_items(uid: str):
     """
     Finds all action items for a user with is_locked: True and updates them to is_locked = False.
     """
-    if os.getenv('SUPABASE_URL') and os.getenv('SUPABASE_ANON_KEY'):
-        supabase.table('action_items').update({'is_locked': False}).eq('uid', uid).eq('is_locked', True).execute()
+    if _USE_SUPABASE:
+        execute_with_reconnect(
+            get_supabase().table('action_items').update({'is_locked': False}).eq('uid', uid).eq('is_locked', True),
+            idempotent=True,
+        )
         print(f"Unlocked all action items for user {uid}")
         return
 
     action_items_ref = db.collection('users').document(uid).collection(action_items_collection)
-    locked_items_query = action_items_ref.where(filter=FieldFilter('is_locked', '==', True))
+    # Only document references are needed, so project away every field
+    locked_items_query = action_items_ref.where(filter=FieldFilter('is_locked', '==', True)).select([])
 
-    batch = db.batch()
-    docs = locked_items_query.stream()
-    count = 0
-    for doc in docs:
-        batch.update(doc.reference, {'is_locked': False})
-        count += 1
-        if count >= 499:  # Firestore batch limit is 500
-            batch.commit()
-            batch = db.batch()
-            count = 0
-    if count > 0:
-        batch.commit()
+    refs = [doc.reference for doc in locked_items_query.stream()]
+    if refs:
+        _commit_in_chunks(refs, _UNLOCK_BATCH_SIZE, lambda batch, ref: batch.update(ref, {'is_locked': False}))
     print(f"Unlocked all action items for user {uid}")
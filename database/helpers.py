@@ -2,8 +2,6 @@ import inspect
 from functools import wraps
 from typing import List, Dict, Any, Callable
 
-from google.cloud import firestore
-
 from database import users as users_db, redis_db
 from ._client import db
 
@@ -20,11 +18,12 @@ def set_data_protection_level(data_arg_name: str):
     """
 
     def decorator(func):
+        sig = inspect.signature(func)
+
         @wraps(func)
         def wrapper(*args, **kwargs):
             # Bind the provided arguments to the function's signature to easily access them by name
             try:
-                sig = inspect.signature(func)
                 bound_args = sig.bind(*args, **kwargs)
                 bound_args.apply_defaults()
             except TypeError:
@@ -88,11 +87,16 @@ def set_data_protection_level(data_arg_name: str):
     return decorator
 
 
-def prepare_for_write(data_arg_name: str, prepare_func: Callable[[Dict[str, Any], str, str], Dict[str, Any]]):
+def prepare_for_write(
+    data_arg_name: str,
+    prepare_func: Callable[[Dict[str, Any], str, str], Dict[str, Any]],
+    bulk_prepare_func: Callable[[List[Dict[str, Any]], str], List[Dict[str, Any]]] | None = None,
+):
     """
     Decorator to prepare data before writing to the database.
     It uses the provided prepare_func to handle the specifics of data preparation,
     such as compression or encryption, based on the data's protection level.
+    When bulk_prepare_func is given, lists are handed to it in one call instead of item by item.
     The decorated function's return value is ignored; the decorator returns the original, unencrypted data.
 
     Assumes 'uid' and the data dictionary (specified by data_arg_name) are arguments
@@ -101,9 +105,10 @@ def prepare_for_write(data_arg_name: str, prepare_func: Callable[[Dict[str, Any]
     """
 
     def decorator(func):
+        sig = inspect.signature(func)
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            sig = inspect.signature(func)
             bound_args = sig.bind(*args, **kwargs)
             bound_args.apply_defaults()
 
@@ -125,9 +130,13 @@ def prepare_for_write(data_arg_name: str, prepare_func: Callable[[Dict[str, Any]
                 prepared_data = prepare_func(original_data, uid, original_data.get('data_protection_level', 'standard'))
             elif isinstance(original_data, list):
                 if original_data and isinstance(original_data[0], dict):
-                    prepared_data = [
-                        prepare_func(item, uid, item.get('data_protection_level', 'standard')) for item in original_data
-                    ]
+                    if bulk_prepare_func is not None:
+                        prepared_data = bulk_prepare_func(original_data, uid)
+                    else:
+                        prepared_data = [
+                            prepare_func(item, uid, item.get('data_protection_level', 'standard'))
+                            for item in original_data
+                        ]
 
             # Modify the bound arguments with the prepared data and reconstruct the call
             bound_args.arguments[data_arg_name] = prepared_data
@@ -141,19 +150,24 @@ def prepare_for_write(data_arg_name: str, prepare_func: Callable[[Dict[str, Any]
     return decorator
 
 
-def prepare_for_read(decrypt_func: Callable[[Dict[str, Any], str], Dict[str, Any]]):
+def prepare_for_read(
+    decrypt_func: Callable[[Dict[str, Any], str], Dict[str, Any]],
+    bulk_decrypt_func: Callable[[List[Any], str], List[Any]] | None = None,
+):
     """
     Decorator to decrypt data after reading from the database.
     It processes the return value of the decorated function. If the return value is a dict or
     list of dicts, it applies the decrypt_func based on the 'data_protection_level' field.
+    When bulk_decrypt_func is given, lists are handed to it in one call instead of item by item.
 
     Assumes 'uid' is an argument to the decorated function to be used for decryption.
     """
 
     def decorator(func):
+        sig = inspect.signature(func)
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            sig = inspect.signature(func)
             bound_args = sig.bind(*args, **kwargs)
             bound_args.apply_defaults()
             uid = bound_args.arguments.get('uid')
@@ -171,10 +185,15 @@ def prepare_for_read(decrypt_func: Callable[[Dict[str, Any], str], Dict[str, Any
                     return decrypt_func(item, uid)
                 return item
 
+            def _process_list(items):
+                if bulk_decrypt_func is not None:
+                    return bulk_decrypt_func(items, uid)
+                return [_process(item) for item in items]
+
             if isinstance(result, dict):
                 return _process(result)
             elif isinstance(result, list):
-                return [_process(item) for item in result]
+                return _process_list(result)
             elif isinstance(result, tuple):
                 # Handle functions that return a tuple, e.g., (data, doc_id)
                 processed_elements = []
@@ -182,7 +201,7 @@ def prepare_for_read(decrypt_func: Callable[[Dict[str, Any], str], Dict[str, Any
                     if isinstance(element, dict):
                         processed_elements.append(_process(element))
                     elif isinstance(element, list):
-                        processed_elements.append([_process(item) for item in element])
+                        processed_elements.append(_process_list(element))
                     else:
                         processed_elements.append(element)
                 return tuple(processed_elements)
@@ -201,9 +220,10 @@ def with_photos(photos_getter: Callable):
     """
 
     def decorator(func):
+        sig = inspect.signature(func)
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            sig = inspect.signature(func)
             bound_args = sig.bind(*args, **kwargs)
             bound_args.apply_defaults()
 
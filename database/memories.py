@@ -1,20 +1,34 @@
-import copy
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import List, Optional, Dict, Any
 
-from google.cloud import firestore
-from google.cloud.firestore_v1 import FieldFilter
-import os
+from postgrest.types import CountMethod, ReturnMethod
 
-from ._client import db
-from database.supabase_client import supabase
-from database import users as users_db
+from ._client import _use_supabase, db
+from models.memories import MemoryDB
+from database.supabase_client import returning_ids, supabase
 from utils import encryption
 from .helpers import set_data_protection_level, prepare_for_write, prepare_for_read
 
+# Composite indexes for the ordered/filtered memory queries below are declared in firestore.indexes.json
 memories_collection = 'memories'
 users_collection = 'users'
 
+# Backend selection is fixed for the lifetime of the process
+_USE_SUPABASE = _use_supabase()
+
+# The Firestore SDK is only needed by the Firestore code paths
+if not _USE_SUPABASE:
+    from google.cloud import firestore
+    from google.cloud.firestore_v1 import FieldFilter
+
+# Reads fetch the columns MemoryDB writes rather than '*', so extra table columns never go over the wire
+_MEMORY_READ_COLUMNS = ','.join(MemoryDB.model_fields)
+
+_DELETE_BATCH_SIZE = 450
+_DELETE_COMMIT_WORKERS = 4
+_MIGRATE_UPDATE_WORKERS = 4
+
 
 # *********************************
 # ******* ENCRYPTION HELPERS ******
@@ -22,7 +36,8 @@ users_collection = 'users'
 
 
 def _encrypt_memory_data(memory_data: Dict[str, Any], uid: str) -> Dict[str, Any]:
-    data = copy.deepcopy(memory_data)
+    # Only 'content' is replaced, so a shallow copy is enough
+    data = dict(memory_data)
 
     if 'content' in data and isinstance(data['content'], str):
         data['content'] = encryption.encrypt(data['content'], uid)
@@ -30,14 +45,15 @@ def _encrypt_memory_data(memory_data: Dict[str, Any], uid: str) -> Dict[str, Any
 
 
 def _decrypt_memory_data(memory_data: Dict[str, Any], uid: str) -> Dict[str, Any]:
-    data = copy.deepcopy(memory_data)
-
-    if 'content' in data and isinstance(data['content'], str):
-        try:
-            data['content'] = encryption.decrypt(data['content'], uid)
-        except Exception:
-            pass
-    return data
+    content = memory_data.get('content')
+    if not isinstance(content, str):
+        return memory_data
+    try:
+        content = encryption.decrypt(content, uid)
+    except Exception:
+        return memory_data
+    # Copy only once there is a decrypted value to put in it
+    return {**memory_data, 'content': content}
 
 
 def _prepare_data_for_write(data: Dict[str, Any], uid: str, level: str) -> Dict[str, Any]:
@@ -46,6 +62,22 @@ def _prepare_data_for_write(data: Dict[str, Any], uid: str, level: str) -> Dict[
     return data
 
 
+def _prepare_memories_for_write_bulk(memories: List[Dict[str, Any]], uid: str) -> List[Dict[str, Any]]:
+    # Encrypt all enhanced contents of a batch with one key derivation
+    enhanced = [
+        i
+        for i, m in enumerate(memories)
+        if m.get('data_protection_level') == 'enhanced' and isinstance(m.get('content'), str)
+    ]
+    if not enhanced:
+        return memories
+    encrypted = encryption.encrypt_many([memories[i]['content'] for i in enhanced], uid)
+    prepared = list(memories)
+    for i, content in zip(enhanced, encrypted):
+        prepared[i] = {**memories[i], 'content': content}
+    return prepared
+
+
 def _prepare_memory_for_read(memory_data: Optional[Dict[str, Any]], uid: str) -> Optional[Dict[str, Any]]:
     if not memory_data:
         return None
@@ -57,17 +89,51 @@ def _prepare_memory_for_read(memory_data: Optional[Dict[str, Any]], uid: str) ->
     return memory_data
 
 
+def _prepare_memories_for_read_bulk(memories: List[Any], uid: str) -> List[Any]:
+    # Single pass over a result page; only enhanced memories are copied and decrypted
+    decrypt = _decrypt_memory_data
+    return [
+        decrypt(m, uid) if isinstance(m, dict) and m.get('data_protection_level') == 'enhanced' else m
+        for m in memories
+    ]
+
+
+def _delete_in_chunks(refs: list):
+    """Delete document refs in write batches of _DELETE_BATCH_SIZE; batches are committed in parallel."""
+    chunks = [refs[i : i + _DELETE_BATCH_SIZE] for i in range(0, len(refs), _DELETE_BATCH_SIZE)]
+
+    def _commit(chunk):
+        batch = db.batch()
+        for ref in chunk:
+            batch.delete(ref)
+        batch.commit()
+
+    if len(chunks) <= 1:
+        for chunk in chunks:
+            _commit(chunk)
+        return
+
+    with ThreadPoolExecutor(max_workers=_DELETE_COMMIT_WORKERS) as executor:
+        list(executor.map(_commit, chunks))
+
+
 # *****************************
 # ********** CRUD *************
 # *****************************
 
 
-@prepare_for_read(decrypt_func=_prepare_memory_for_read)
+@prepare_for_read(decrypt_func=_prepare_memory_for_read, bulk_decrypt_func=_prepare_memories_for_read_bulk)
 def get_memories(uid: str, limit: int = 100, offset: int = 0, categories: List[str] = []):
     print('get_memories db', uid, limit, offset, categories)
-    if os.getenv('SUPABASE_URL') and os.getenv('SUPABASE_ANON_KEY'):
+    if _USE_SUPABASE:
         try:
-            q = supabase.table('memories').select('*').eq('uid', uid)
+            # Rejected memories are excluded server-side so a page holds up to `limit` rows
+            q = (
+                supabase.table('memories')
+                .select(_MEMORY_READ_COLUMNS)
+                .eq('uid', uid)
+                .or_('user_review.is.null,user_review.eq.true')
+            )
             if categories:
                 q = q.in_('category', categories)
             # Order by scoring desc then created_at desc
@@ -82,8 +148,7 @@ def get_memories(uid: str, limit: int = 100, offset: int = 0, categories: List[s
             res = q.execute()
             memories = res.data or []
             print("get_memories", len(memories))
-            result = [m for m in memories if m.get('user_review') is not False]
-            return result
+            return memories
         except Exception as e:
             print('supabase get_memories error', e)
             return []
@@ -106,14 +171,14 @@ def get_memories(uid: str, limit: int = 100, offset: int = 0, categories: List[s
     return result
 
 
-@prepare_for_read(decrypt_func=_prepare_memory_for_read)
+@prepare_for_read(decrypt_func=_prepare_memory_for_read, bulk_decrypt_func=_prepare_memories_for_read_bulk)
 def get_user_public_memories(uid: str, limit: int = 100, offset: int = 0):
     print('get_public_memories', limit, offset)
-    if os.getenv('SUPABASE_URL') and os.getenv('SUPABASE_ANON_KEY'):
+    if _USE_SUPABASE:
         try:
             q = (
                 supabase.table('memories')
-                .select('*')
+                .select(_MEMORY_READ_COLUMNS)
                 .eq('uid', uid)
                 .eq('visibility', 'public')
                 .order('scoring', desc=True)
@@ -136,22 +201,20 @@ def get_user_public_memories(uid: str, limit: int = 100, offset: int = 0):
 
     memories_ref = memories_ref.limit(limit).offset(offset)
 
+    # Older documents have no visibility field and count as public, which a server-side equality filter would
+    # skip. New writes default the field, but until existing documents are backfilled this stays in memory.
     memories = [doc.to_dict() for doc in memories_ref.stream()]
+    return [memory for memory in memories if memory.get('visibility', 'public') == 'public']
 
-    # Consider visibility as 'public' if it's missing
-    public_memories = [memory for memory in memories if memory.get('visibility', 'public') == 'public']
-
-    return public_memories
 
-
-@prepare_for_read(decrypt_func=_prepare_memory_for_read)
+@prepare_for_read(decrypt_func=_prepare_memory_for_read, bulk_decrypt_func=_prepare_memories_for_read_bulk)
 def get_non_filtered_memories(uid: str, limit: int = 100, offset: int = 0):
     print('get_non_filtered_memories', uid, limit, offset)
-    if os.getenv('SUPABASE_URL') and os.getenv('SUPABASE_ANON_KEY'):
+    if _USE_SUPABASE:
         try:
             q = (
                 supabase.table('memories')
-                .select('*')
+                .select(_MEMORY_READ_COLUMNS)
                 .eq('uid', uid)
                 .order('created_at', desc=True)
             )
@@ -175,38 +238,27 @@ def get_non_filtered_memories(uid: str, limit: int = 100, offset: int = 0):
 @set_data_protection_level(data_arg_name='data')
 @prepare_for_write(data_arg_name='data', prepare_func=_prepare_data_for_write)
 def create_memory(uid: str, data: dict):
-    if os.getenv('SUPABASE_URL') and os.getenv('SUPABASE_ANON_KEY'):
-        payload = data.copy()
-        payload['uid'] = uid
-        if 'created_at' in payload and isinstance(payload['created_at'], datetime):
-            payload['created_at'] = payload['created_at'].isoformat()
-        if 'updated_at' in payload and isinstance(payload['updated_at'], datetime):
-            payload['updated_at'] = payload['updated_at'].isoformat()
-        supabase.table('memories').upsert(payload).execute()
+    if _USE_SUPABASE:
+        # The PostgREST session encodes with orjson, so datetimes are sent as-is
+        supabase.table('memories').upsert({**data, 'uid': uid}, returning=ReturnMethod.minimal).execute()
         return
     user_ref = db.collection(users_collection).document(uid)
     memories_ref = user_ref.collection(memories_collection)
     memory_ref = memories_ref.document(data['id'])
-    memory_ref.set(data)
+    memory_ref.set({'visibility': 'public', **data})
 
 
 @set_data_protection_level(data_arg_name='data')
-@prepare_for_write(data_arg_name='data', prepare_func=_prepare_data_for_write)
+@prepare_for_write(
+    data_arg_name='data', prepare_func=_prepare_data_for_write, bulk_prepare_func=_prepare_memories_for_write_bulk
+)
 def save_memories(uid: str, data: List[dict]):
     if not data:
         return
-    if os.getenv('SUPABASE_URL') and os.getenv('SUPABASE_ANON_KEY'):
-        rows = []
-        for memory in data:
-            payload = memory.copy()
-            payload['uid'] = uid
-            if 'created_at' in payload and isinstance(payload['created_at'], datetime):
-                payload['created_at'] = payload['created_at'].isoformat()
-            if 'updated_at' in payload and isinstance(payload['updated_at'], datetime):
-                payload['updated_at'] = payload['updated_at'].isoformat()
-            rows.append(payload)
-        if rows:
-            supabase.table('memories').upsert(rows).execute()
+    if _USE_SUPABASE:
+        # The PostgREST session encodes with orjson, so datetimes are sent as-is
+        rows = [{**memory, 'uid': uid} for memory in data]
+        supabase.table('memories').upsert(rows, returning=ReturnMethod.minimal).execute()
         return
 
     batch = db.batch()
@@ -214,27 +266,25 @@ def save_memories(uid: str, data: List[dict]):
     memories_ref = user_ref.collection(memories_collection)
     for memory in data:
         memory_ref = memories_ref.document(memory['id'])
-        batch.set(memory_ref, memory)
+        batch.set(memory_ref, {'visibility': 'public', **memory})
     batch.commit()
 
 
 def delete_memories(uid: str):
-    if os.getenv('SUPABASE_URL') and os.getenv('SUPABASE_ANON_KEY'):
-        supabase.table('memories').delete().eq('uid', uid).execute()
+    if _USE_SUPABASE:
+        supabase.table('memories').delete(returning=ReturnMethod.minimal).eq('uid', uid).execute()
         return
-    batch = db.batch()
     user_ref = db.collection(users_collection).document(uid)
     memories_ref = user_ref.collection(memories_collection)
-    for doc in memories_ref.stream():
-        batch.delete(doc.reference)
-    batch.commit()
+    # Only document references are needed, so project away every field
+    _delete_in_chunks([doc.reference for doc in memories_ref.select([]).stream()])
 
 
 @prepare_for_read(decrypt_func=_prepare_memory_for_read)
 def get_memory(uid: str, memory_id: str):
-    if os.getenv('SUPABASE_URL') and os.getenv('SUPABASE_ANON_KEY'):
+    if _USE_SUPABASE:
         res = (
-            supabase.table('memories').select('*').eq('uid', uid).eq('id', memory_id).single().execute()
+            supabase.table('memories').select(_MEMORY_READ_COLUMNS).eq('uid', uid).eq('id', memory_id).single().execute()
         )
         return res.data if res and getattr(res, 'data', None) else None
     user_ref = db.collection(users_collection).document(uid)
@@ -245,8 +295,14 @@ def get_memory(uid: str, memory_id: str):
 
 
 def review_memory(uid: str, memory_id: str, value: bool):
-    if os.getenv('SUPABASE_URL') and os.getenv('SUPABASE_ANON_KEY'):
-        supabase.table('memories').update({'reviewed': True, 'user_review': value}).eq('uid', uid).eq('id', memory_id).execute()
+    if _USE_SUPABASE:
+        (
+            supabase.table('memories')
+            .update({'reviewed': True, 'user_review': value}, returning=ReturnMethod.minimal)
+            .eq('uid', uid)
+            .eq('id', memory_id)
+            .execute()
+        )
         return
     user_ref = db.collection(users_collection).document(uid)
     memories_ref = user_ref.collection(memories_collection)
@@ -255,8 +311,14 @@ def review_memory(uid: str, memory_id: str, value: bool):
 
 
 def change_memory_visibility(uid: str, memory_id: str, value: str):
-    if os.getenv('SUPABASE_URL') and os.getenv('SUPABASE_ANON_KEY'):
-        supabase.table('memories').update({'visibility': value}).eq('uid', uid).eq('id', memory_id).execute()
+    if _USE_SUPABASE:
+        (
+            supabase.table('memories')
+            .update({'visibility': value}, returning=ReturnMethod.minimal)
+            .eq('uid', uid)
+            .eq('id', memory_id)
+            .execute()
+        )
         return
     user_ref = db.collection(users_collection).document(uid)
     memories_ref = user_ref.collection(memories_collection)
@@ -265,16 +327,27 @@ def change_memory_visibility(uid: str, memory_id: str, value: str):
 
 
 def edit_memory(uid: str, memory_id: str, value: str):
-    if os.getenv('SUPABASE_URL') and os.getenv('SUPABASE_ANON_KEY'):
-        # Fetch to determine encryption level
-        res = supabase.table('memories').select('data_protection_level').eq('uid', uid).eq('id', memory_id).single().execute()
-        if not res or not getattr(res, 'data', None):
+    if _USE_SUPABASE:
+        # Let the level filter pick the content variant instead of reading the level first: enhanced is the
+        # default level, so the encrypted write usually lands in one round trip
+        update_data = {'edited': True, 'updated_at': datetime.now(timezone.utc).isoformat()}
+        q = (
+            supabase.table('memories')
+            .update({**update_data, 'content': encryption.encrypt(value, uid)})
+            .eq('uid', uid)
+            .eq('id', memory_id)
+            .eq('data_protection_level', 'enhanced')
+        )
+        if returning_ids(q).execute().data:
             return
-        doc_level = res.data.get('data_protection_level', 'standard')
-        content = value
-        if doc_level == 'enhanced':
-            content = encryption.encrypt(content, uid)
-        supabase.table('memories').update({'content': content, 'edited': True, 'updated_at': datetime.now(timezone.utc).isoformat()}).eq('uid', uid).eq('id', memory_id).execute()
+        q = (
+            supabase.table('memories')
+            .update({**update_data, 'content': value})
+            .eq('uid', uid)
+            .eq('id', memory_id)
+            .or_('data_protection_level.is.null,data_protection_level.neq.enhanced')
+        )
+        returning_ids(q).execute()
         return
     user_ref = db.collection(users_collection).document(uid)
     memories_ref = user_ref.collection(memories_collection)
@@ -293,8 +366,8 @@ def edit_memory(uid: str, memory_id: str, value: str):
 
 
 def delete_memory(uid: str, memory_id: str):
-    if os.getenv('SUPABASE_URL') and os.getenv('SUPABASE_ANON_KEY'):
-        supabase.table('memories').delete().eq('uid', uid).eq('id', memory_id).execute()
+    if _USE_SUPABASE:
+        supabase.table('memories').delete(returning=ReturnMethod.minimal).eq('uid', uid).eq('id', memory_id).execute()
         return
     user_ref = db.collection(users_collection).document(uid)
     memories_ref = user_ref.collection(memories_collection)
@@ -303,41 +376,42 @@ def delete_memory(uid: str, memory_id: str):
 
 
 def delete_all_memories(uid: str):
-    if os.getenv('SUPABASE_URL') and os.getenv('SUPABASE_ANON_KEY'):
-        supabase.table('memories').delete().eq('uid', uid).execute()
+    if _USE_SUPABASE:
+        supabase.table('memories').delete(returning=ReturnMethod.minimal).eq('uid', uid).execute()
         return
     user_ref = db.collection(users_collection).document(uid)
     memories_ref = user_ref.collection(memories_collection)
-    batch = db.batch()
-    for doc in memories_ref.stream():
-        batch.delete(doc.reference)
-    batch.commit()
+    # Only document references are needed, so project away every field
+    _delete_in_chunks([doc.reference for doc in memories_ref.select([]).stream()])
 
 
 def delete_memories_for_conversation(uid: str, memory_id: str):
-    if os.getenv('SUPABASE_URL') and os.getenv('SUPABASE_ANON_KEY'):
-        res = supabase.table('memories').delete().eq('uid', uid).eq('memory_id', memory_id).execute()
+    if _USE_SUPABASE:
+        q = supabase.table('memories').delete().eq('uid', uid).eq('memory_id', memory_id)
+        res = returning_ids(q).execute()
         print('delete_memories_for_conversation', memory_id, len(res.data or []))
         return
-    batch = db.batch()
     user_ref = db.collection(users_collection).document(uid)
     memories_ref = user_ref.collection(memories_collection)
-    query = memories_ref.where(filter=FieldFilter('memory_id', '==', memory_id))
+    query = memories_ref.where(filter=FieldFilter('memory_id', '==', memory_id)).select([])
 
-    removed_ids = []
-    for doc in query.stream():
-        batch.delete(doc.reference)
-        removed_ids.append(doc.id)
-    batch.commit()
-    print('delete_memories_for_conversation', memory_id, len(removed_ids))
+    removed_refs = [doc.reference for doc in query.stream()]
+    _delete_in_chunks(removed_refs)
+    print('delete_memories_for_conversation', memory_id, len(removed_refs))
 
 
 def unlock_all_memories(uid: str):
     """
     Finds all memories for a user with is_locked: True and updates them to is_locked = False.
     """
-    if os.getenv('SUPABASE_URL') and os.getenv('SUPABASE_ANON_KEY'):
-        supabase.table('memories').update({'is_locked': False}).eq('uid', uid).eq('is_locked', True).execute()
+    if _USE_SUPABASE:
+        (
+            supabase.table('memories')
+            .update({'is_locked': False}, returning=ReturnMethod.minimal)
+            .eq('uid', uid)
+            .eq('is_locked', True)
+            .execute()
+        )
         print(f"Unlocked all memories for user {uid}")
         return
     memories_ref = db.collection(users_collection).document(uid).collection(memories_collection)
@@ -365,20 +439,25 @@ def unlock_all_memories(uid: str):
 
 def get_memories_to_migrate(uid: str, target_level: str) -> List[dict]:
     """
-    Finds all memories that are not at the target protection level by fetching all documents
-    and filtering them in memory. This simplifies the code but may be less performant for
-    users with a very large number of documents.
+    Finds all memories that are not at the target protection level. A missing level counts as 'standard'.
+    The level filter runs server-side, except for Firestore migrations away from 'standard', where documents
+    without the field can't be matched by a query and are filtered in memory instead.
     """
-    if os.getenv('SUPABASE_URL') and os.getenv('SUPABASE_ANON_KEY'):
-        res = supabase.table('memories').select('id,data_protection_level').eq('uid', uid).execute()
-        to_migrate = []
-        for row in (res.data or []):
-            current_level = row.get('data_protection_level', 'standard')
-            if target_level != current_level:
-                to_migrate.append({'id': row.get('id'), 'type': 'memory'})
-        return to_migrate
+    if _USE_SUPABASE:
+        q = supabase.table('memories').select('id').eq('uid', uid)
+        if target_level == 'standard':
+            # neq never matches NULL, which already counts as standard
+            q = q.neq('data_protection_level', 'standard')
+        else:
+            q = q.or_(f'data_protection_level.neq.{target_level},data_protection_level.is.null')
+        res = q.execute()
+        return [{'id': row['id'], 'type': 'memory'} for row in res.data or []]
 
     memories_ref = db.collection(users_collection).document(uid).collection(memories_collection)
+    if target_level == 'standard':
+        query = memories_ref.where(filter=FieldFilter('data_protection_level', '!=', 'standard')).select([])
+        return [{'id': doc.id, 'type': 'memory'} for doc in query.stream()]
+
     all_memories = memories_ref.select(['data_protection_level']).stream()
 
     to_migrate = []
@@ -395,18 +474,37 @@ def migrate_memories_level_batch(uid: str, memory_ids: List[str], target_level:
     """
     Migrates a batch of memories to the target protection level.
     """
-    if os.getenv('SUPABASE_URL') and os.getenv('SUPABASE_ANON_KEY'):
+    if _USE_SUPABASE:
         res = supabase.table('memories').select('id,content,data_protection_level').eq('uid', uid).in_('id', memory_ids).execute()
-        rows = res.data or []
-        for row in rows:
-            current_level = row.get('data_protection_level', 'standard')
-            if current_level == target_level:
-                continue
-            plain_content = row.get('content')
-            migrated_content = plain_content
-            if target_level == 'enhanced' and isinstance(plain_content, str):
-                migrated_content = encryption.encrypt(plain_content, uid)
-            supabase.table('memories').update({'data_protection_level': target_level, 'content': migrated_content}).eq('uid', uid).eq('id', row.get('id')).execute()
+        rows = [row for row in res.data or [] if row.get('data_protection_level', 'standard') != target_level]
+        # Only moving to 'enhanced' rewrites content; every other row just needs its level changed
+        to_encrypt = [row for row in rows if isinstance(row.get('content'), str)] if target_level == 'enhanced' else []
+        encrypted_ids = {row['id'] for row in to_encrypt}
+        level_only_ids = [row['id'] for row in rows if row['id'] not in encrypted_ids]
+
+        # Plain UPDATEs rather than an upsert: partial rows would go through INSERT and trip NOT NULL columns
+        if level_only_ids:
+            (
+                supabase.table('memories')
+                .update({'data_protection_level': target_level}, returning=ReturnMethod.minimal)
+                .eq('uid', uid)
+                .in_('id', level_only_ids)
+                .execute()
+            )
+
+        def _update_content(row_id: str, content: str):
+            (
+                supabase.table('memories')
+                .update({'data_protection_level': target_level, 'content': content}, returning=ReturnMethod.minimal)
+                .eq('uid', uid)
+                .eq('id', row_id)
+                .execute()
+            )
+
+        if to_encrypt:
+            encrypted = encryption.encrypt_many([row['content'] for row in to_encrypt], uid)
+            with ThreadPoolExecutor(max_workers=_MIGRATE_UPDATE_WORKERS) as executor:
+                list(executor.map(_update_content, [row['id'] for row in to_encrypt], encrypted))
         return
 
     batch = db.batch()
@@ -414,6 +512,7 @@ def migrate_memories_level_batch(uid: str, memory_ids: List[str], target_level:
     doc_refs = [memories_ref.document(mem_id) for mem_id in memory_ids]
     doc_snapshots = db.get_all(doc_refs)
 
+    updates = []
     for doc_snapshot in doc_snapshots:
         if not doc_snapshot.exists:
             print(f"Memory {doc_snapshot.id} not found, skipping.")
@@ -427,16 +526,18 @@ def migrate_memories_level_batch(uid: str, memory_ids: List[str], target_level:
 
         # Decrypt the data first (if needed) to get a clean slate.
         plain_data = _prepare_memory_for_read(memory_data, uid)
+        update_data = {'data_protection_level': target_level, 'content': plain_data.get('content')}
+        updates.append((doc_snapshot.reference, update_data))
 
-        plain_content = plain_data.get('content')
-        migrated_content = plain_content
-        if target_level == 'enhanced':
-            if isinstance(plain_content, str):
-                migrated_content = encryption.encrypt(plain_content, uid)
+    if target_level == 'enhanced':
+        to_encrypt = [update_data for _, update_data in updates if isinstance(update_data['content'], str)]
+        encrypted = encryption.encrypt_many([update_data['content'] for update_data in to_encrypt], uid)
+        for update_data, content in zip(to_encrypt, encrypted):
+            update_data['content'] = content
 
-        # Update the document with the migrated data and the new protection level.
-        update_data = {'data_protection_level': target_level, 'content': migrated_content}
-        batch.update(doc_snapshot.reference, update_data)
+    # Update the documents with the migrated data and the new protection level.
+    for doc_ref, update_data in updates:
+        batch.update(doc_ref, update_data)
 
     batch.commit()
 
@@ -448,21 +549,18 @@ def migrate_memories(prev_uid: str, new_uid: str, app_id: str = None):
     """
     print(f'Migrating memories from {prev_uid} to {new_uid}')
 
-    if os.getenv('SUPABASE_URL') and os.getenv('SUPABASE_ANON_KEY'):
-        q = supabase.table('memories').select('*').eq('uid', prev_uid)
+    if _USE_SUPABASE:
+        # Rows are keyed by id, so re-owning them is a single server-side UPDATE of uid
+        q = supabase.table('memories').update({'uid': new_uid}, count=CountMethod.exact).eq('uid', prev_uid)
         if app_id:
             q = q.eq('app_id', app_id)
-        res = q.execute()
-        rows = res.data or []
-        if not rows:
+        res = returning_ids(q).execute()
+        migrated = res.count if res.count is not None else len(res.data or [])
+        if not migrated:
             print(f'No memories to migrate for user {prev_uid}')
             return 0
-        # Upsert with new uid
-        for row in rows:
-            row['uid'] = new_uid
-        supabase.table('memories').upsert(rows).execute()
-        print(f'Migrated {len(rows)} memories from {prev_uid} to {new_uid}')
-        return len(rows)
+        print(f'Migrated {migrated} memories from {prev_uid} to {new_uid}')
+        return migrated
 
     # Get source memories
     prev_user_ref = db.collection(users_collection).document(prev_uid)
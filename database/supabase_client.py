@@ -1,12 +1,64 @@
 """
 Supabase database client - replaces Firebase/Firestore
 """
+import asyncio
+import functools
+import logging
 import os
-import json
+import random
+import time
 from typing import Dict, List, Optional, Any
-from datetime import datetime
+from datetime import datetime, timezone
+
+import httpx
+import orjson
+from postgrest.utils import SyncClient
 from supabase import create_client, Client
 
+logger = logging.getLogger(__name__)
+
+DB_DEFAULT_MAX_RETRIES = 6
+
+# Shared HTTP/2 PostgREST connection pool; transport retries only cover failed connection attempts
+_POSTGREST_LIMITS = httpx.Limits(max_keepalive_connections=40, max_connections=60, keepalive_expiry=60)
+
+# Errors raised before the request left this process; retrying these can never apply a write twice
+_NOT_SENT_ERRORS = (httpx.ConnectError, httpx.PoolTimeout)
+# A pooled keepalive connection dropped by the server may surface only after the request was sent, so this one
+# is retried for idempotent queries only
+_TRANSIENT_ERRORS = _NOT_SENT_ERRORS + (httpx.RemoteProtocolError,)
+
+
+# Naive datetimes are treated as UTC, matching how PostgREST stores timestamptz from offset-less strings
+_ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+class _OrjsonSyncClient(SyncClient):
+    """PostgREST session that encodes request bodies with orjson, so rows can carry datetimes directly"""
+
+    def request(self, method, url, **kwargs):
+        # postgrest passes the body as httpx's json= keyword
+        json_body = kwargs.pop('json', None)
+        if json_body is not None:
+            kwargs['content'] = orjson.dumps(json_body, option=_ORJSON_OPTIONS)
+            headers = httpx.Headers(kwargs.get('headers'))
+            headers.setdefault('Content-Type', 'application/json')
+            kwargs['headers'] = headers
+        return super().request(method, url, **kwargs)
+
+
+def _pool_postgrest_session(client: Client):
+    session = client.postgrest.session
+    client.postgrest.session = _OrjsonSyncClient(
+        base_url=session.base_url,
+        headers=session.headers,
+        timeout=session.timeout,
+        follow_redirects=True,
+        transport=httpx.HTTPTransport(http2=True, retries=3, limits=_POSTGREST_LIMITS),
+    )
+    session.close()
+
+
 # Initialize Supabase client
 def get_supabase_client() -> Client:
     """Get or create Supabase client"""
@@ -17,17 +69,75 @@ def get_supabase_client() -> Client:
         # For testing, use mock values
         url = url or "https://mock.supabase.co"
         key = key or "mock-key"
-        print(f"⚠️ Using mock Supabase credentials: {url}")
+        logger.warning("Using mock Supabase credentials: %s", url)
+
+    client = create_client(url, key)
+    # Rows carry raw datetimes that only the orjson session can encode, so there is no fallback to the default one
+    _pool_postgrest_session(client)
+    return client
+
+
+@functools.cache
+def get_supabase() -> Client:
+    """Process-wide Supabase client, created on first use"""
+    return get_supabase_client()
+
+
+def _on_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def execute_with_reconnect(query, max_retries: int = DB_DEFAULT_MAX_RETRIES, idempotent: bool = False):
+    """
+    Execute a PostgREST query, retrying with exponential backoff and jitter when the connection drops.
+
+    Writes that aren't idempotent are only retried when the request was never sent. The backoff sleeps block,
+    so on an event loop thread the query is tried once; async callers should go through asyncio.to_thread.
+    """
+    retry_on = _TRANSIENT_ERRORS if idempotent else _NOT_SENT_ERRORS
+    attempts = 1 if _on_event_loop() else max_retries
+    for attempt in range(attempts):
+        try:
+            return query.execute()
+        except retry_on as e:
+            if attempt == attempts - 1:
+                raise
+            delay = min(0.1 * (2**attempt), 3.0) * random.uniform(0.5, 1.5)
+            logger.warning("Supabase connection error, retrying in %.2fs: %s", delay, e)
+            time.sleep(delay)
+
+
+def returning_ids(query):
+    """
+    Make an update or delete echo back only the ids of the affected rows instead of the whole rows.
+
+    postgrest-py has no public option for a mutation's returned columns, and return=minimal loses the
+    Content-Range count because the empty body fails to parse. So the select parameter is set on the builder here,
+    and only here.
+    """
+    query.params = query.params.add('select', 'id')
+    return query
 
-    return create_client(url, key)
 
 # Global client instance
-supabase: Client = get_supabase_client()
+supabase: Client = get_supabase()
+
+
+def _now_iso() -> str:
+    """Timezone-aware UTC timestamp for created_at/updated_at; utcnow() is naive and deprecated"""
+    return datetime.now(timezone.utc).isoformat(timespec='milliseconds')
+
 
 # Helper functions to mimic Firestore API
 class SupabaseFirestoreAdapter:
     """Adapter to make Supabase work like Firestore"""
 
+    __slots__ = ('client',)
+
     def __init__(self, client: Client):
         self.client = client
 
@@ -37,6 +147,8 @@ class SupabaseFirestoreAdapter:
 class SupabaseCollection:
     """Supabase collection that mimics Firestore collection"""
 
+    __slots__ = ('client', 'table_name')
+
     def __init__(self, client: Client, table_name: str):
         self.client = client
         self.table_name = table_name
@@ -47,7 +159,7 @@ class SupabaseCollection:
     def add(self, data: Dict[str, Any]):
         """Add document (like Firestore add)"""
         # Add timestamp fields
-        now = datetime.utcnow().isoformat()
+        now = _now_iso()
         data_with_timestamps = {
             **data,
             'created_at': now,
@@ -81,6 +193,8 @@ class SupabaseCollection:
 class SupabaseDocument:
     """Supabase document that mimics Firestore document"""
 
+    __slots__ = ('client', 'table_name', 'doc_id')
+
     def __init__(self, client: Client, table_name: str, doc_id: str = None):
         self.client = client
         self.table_name = table_name
@@ -88,7 +202,7 @@ class SupabaseDocument:
 
     def set(self, data: Dict[str, Any]):
         """Set document data"""
-        now = datetime.utcnow().isoformat()
+        now = _now_iso()
         data_with_timestamps = {
             **data,
             'updated_at': now,
@@ -110,7 +224,7 @@ class SupabaseDocument:
         if not self.doc_id:
             raise Exception("Cannot update document without ID")
 
-        data['updated_at'] = datetime.utcnow().isoformat()
+        data['updated_at'] = _now_iso()
         result = self.client.table(self.table_name).update(data).eq('id', self.doc_id).execute()
         return result
 
@@ -133,9 +247,23 @@ class SupabaseDocument:
             return SupabaseDocumentSnapshot(result.data[0])
         return None
 
+# Firestore where() operators mapped onto PostgREST filter builders
+_FILTER_OPS = {
+    '==': lambda q, f, v: q.eq(f, v),
+    '!=': lambda q, f, v: q.neq(f, v),
+    '>': lambda q, f, v: q.gt(f, v),
+    '>=': lambda q, f, v: q.gte(f, v),
+    '<': lambda q, f, v: q.lt(f, v),
+    '<=': lambda q, f, v: q.lte(f, v),
+    'in': lambda q, f, v: q.in_(f, v),
+}
+
+
 class SupabaseQuery:
     """Supabase query that mimics Firestore query"""
 
+    __slots__ = ('client', 'table_name', 'filters', 'order_field', 'order_direction', 'limit_count')
+
     def __init__(self, client: Client, table_name: str, filters: List = None,
                  order_field: str = None, order_direction: str = 'asc',
                  limit_count: int = None):
@@ -172,22 +300,11 @@ class SupabaseQuery:
         """Execute query and return results"""
         query = self.client.table(self.table_name).select("*")
 
-        # Apply filters
+        # Apply filters; unsupported operators are ignored
         for field, op, value in self.filters:
-            if op == '==':
-                query = query.eq(field, value)
-            elif op == '!=':
-                query = query.neq(field, value)
-            elif op == '>':
-                query = query.gt(field, value)
-            elif op == '>=':
-                query = query.gte(field, value)
-            elif op == '<':
-                query = query.lt(field, value)
-            elif op == '<=':
-                query = query.lte(field, value)
-            elif op == 'in':
-                query = query.in_(field, value)
+            apply_filter = _FILTER_OPS.get(op)
+            if apply_filter is not None:
+                query = apply_filter(query, field, value)
 
         # Apply ordering
         if self.order_field:
@@ -204,6 +321,8 @@ class SupabaseQuery:
 class SupabaseDocumentSnapshot:
     """Supabase document snapshot that mimics Firestore document snapshot"""
 
+    __slots__ = ('_data', 'id')
+
     def __init__(self, data: Dict[str, Any]):
         self._data = data
         self.id = data.get('id')
@@ -219,6 +338,8 @@ class SupabaseDocumentSnapshot:
 class SupabaseDocumentReference:
     """Supabase document reference"""
 
+    __slots__ = ('client', 'table_name', 'id')
+
     def __init__(self, client: Client, table_name: str, doc_id: str):
         self.client = client
         self.table_name = table_name
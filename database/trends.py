@@ -6,7 +6,7 @@ from google.api_core.retry import Retry
 
 from models.conversation import Conversation
 from models.trend import Trend, valid_items
-from ._client import db, document_id_from_seed
+from ._client import db, document_id_from_seed, document_ids_from_seeds
 
 
 def get_trends_data() -> List[Dict]:
@@ -61,8 +61,7 @@ def save_trends(memory: Conversation, trends: List[Trend]):
 
         topics_coll_ref = category_doc_ref.collection('topics')
 
-        for topic in topics:
-            topic_id = document_id_from_seed(topic)
+        for topic, topic_id in zip(topics, document_ids_from_seeds(topics)):
             topic_doc_ref = topics_coll_ref.document(topic_id)
 
             topic_doc_ref.set({"id": topic_id, "topic": topic}, merge=True)
@@ -33,6 +33,7 @@
       other,
   )
 
+  from utils.other.compression import JSONGZipMiddleware
   from utils.other.timeout import TimeoutMiddleware
 
   if not firebase_admin._apps:
@@ -98,6 +99,7 @@
   }
 
   app.add_middleware(TimeoutMiddleware, methods_timeout=methods_timeout)
+  app.add_middleware(JSONGZipMiddleware, minimum_size=1024, compresslevel=6)
 
   modal_app = App(
       name='backend',
@@ -121,5 +123,4 @@
 
   paths = ['_temp', '_samples', '_segments', '_speech_profiles']
   for path in paths:
-      if not os.path.exists(path):
-          os.makedirs(path)
+      os.makedirs(path, exist_ok=True)
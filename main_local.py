@@ -6,7 +6,9 @@ from dotenv import load_dotenv
 load_dotenv()
 
 import firebase_admin
+import orjson
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse, Response
 
 # Initialize Firebase with minimal configuration
 try:
@@ -20,7 +22,7 @@ try:
 except Exception as e:
     print(f"Firebase initialization failed: {e}")
 
-app = FastAPI(title="Taya Backend", version="1.0.0")
+app = FastAPI(title="Taya Backend", version="1.0.0", default_response_class=ORJSONResponse)
 
 # Basic routers that should work without complex dependencies
 from routers import (
@@ -34,21 +36,24 @@ app.include_router(other.router)
 app.include_router(simple_test.router)
 app.include_router(auth_oauth.router)
 
-@app.get("/")
+# Both bodies are constant, so they are encoded once instead of on every request
+_ROOT_BODY = orjson.dumps({"message": "Taya Backend is running!", "status": "healthy"})
+_HEALTH_BODY = orjson.dumps({"status": "healthy", "service": "taya-backend"})
+
+@app.get("/", response_class=Response)
 async def root():
-    return {"message": "Taya Backend is running!", "status": "healthy"}
+    return Response(_ROOT_BODY, media_type="application/json")
 
-@app.get("/health")
+@app.get("/health", response_class=Response)
 async def health():
-    return {"status": "healthy", "service": "taya-backend"}
+    return Response(_HEALTH_BODY, media_type="application/json")
 
 # Create required directories
 paths = ['_temp', '_samples', '_segments', '_speech_profiles']
 for path in paths:
-    if not os.path.exists(path):
-        os.makedirs(path)
-        print(f"Created directory: {path}")
+    os.makedirs(path, exist_ok=True)
 
 if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8080)
\ No newline at end of file
+    from utils.other.server import serve
+
+    serve(app, "main_local:app", port=8080)
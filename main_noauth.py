@@ -1,33 +1,36 @@
 #!/usr/bin/env python3
 
 import json
+import logging
 import os
 
-print("🚀 Starting Taya Backend with Supabase (No Auth)...")
+import orjson
+
+logging.basicConfig(level=os.environ.get("LOG_LEVEL", "INFO"))
+log = logging.getLogger("taya.boot")
+
+log.info("🚀 Starting Taya Backend with Supabase (No Auth)...")
 
 # Set up Supabase credentials
 SUPABASE_URL = os.getenv('SUPABASE_URL', 'https://placeholder.supabase.co')
 SUPABASE_ANON_KEY = os.getenv('SUPABASE_ANON_KEY', 'placeholder-key')
 
-print(f"🔗 Supabase URL: {SUPABASE_URL}")
-print(f"🔑 Supabase Key: {SUPABASE_ANON_KEY[:20]}...")
+log.info("🔗 Supabase URL: %s", SUPABASE_URL)
+log.info("🔑 Supabase Key: %s...", SUPABASE_ANON_KEY[:20])
 
 # Do not monkey-patch firebase_admin; rely on dependency overrides only
 
 # Mock user ID for all operations (no auth required)
 MOCK_USER_ID = "noauth-user-12345"
-print(f"🔓 Authentication disabled. Using mock user: {MOCK_USER_ID}")
+log.info("🔓 Authentication disabled. Using mock user: %s", MOCK_USER_ID)
 
-# Import Header for correct dependency signature
-from fastapi import Header
-
-# Override the authentication function to always return mock user
-def mock_get_current_user_uid(authorization: str = Header(None)):
+# Override the authentication functions to always return mock user
+async def mock_get_current_user_uid():
     """
     Mock authentication function that always returns the same user ID
     This bypasses all authentication while keeping full database functionality
     """
-    print(f"🔓 Authentication bypassed, returning mock user: {MOCK_USER_ID}")
+    # No parameters and async: FastAPI awaits it inline instead of sending it to the threadpool per request
     return MOCK_USER_ID
 
 # Configure environment variables to allow ADMIN_KEY bypass if any code paths rely on it
@@ -35,11 +38,13 @@ os.environ['LOCAL_DEVELOPMENT'] = 'true'
 os.environ['ADMIN_KEY'] = 'BYPASS_AUTH_'
 os.environ['DISABLE_FIREBASE'] = 'true'
 os.environ['MOCK_USER_ID'] = MOCK_USER_ID
-print("🔧 Environment variables set for auth bypass")
+log.info("🔧 Environment variables set for auth bypass")
 
 # Import FastAPI and routers
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response
+from utils.other.compression import JSONGZipMiddleware
 
 # Import routers AFTER monkey-patching
 from routers import (
@@ -54,7 +59,7 @@ from routers import (
     apps,
 )
 
-app = FastAPI(title="Taya Backend - Supabase No Auth", version="3.0.0")
+app = FastAPI(title="Taya Backend - Supabase No Auth", version="3.0.0", default_response_class=ORJSONResponse)
 
 # Enable CORS
 app.add_middleware(
@@ -65,25 +70,21 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Conversation and memory lists carry full transcripts and compress well; chat streams are left as-is
+app.add_middleware(JSONGZipMiddleware, minimum_size=1024, compresslevel=6)
+
 # Override dependencies using FastAPI's dependency override system
 from utils.other.endpoints import get_current_user_uid as real_get_current_user_uid
 from dependencies import get_current_user_id as real_get_current_user_id
 from dependencies import get_uid_from_mcp_api_key as real_get_uid_from_mcp_api_key
 
 app.dependency_overrides[real_get_current_user_uid] = mock_get_current_user_uid
-
-async def _mock_get_current_user_id(*args, **kwargs):
-    return MOCK_USER_ID
-
-async def _mock_get_uid_from_mcp_api_key(*args, **kwargs):
-    return MOCK_USER_ID
-
-app.dependency_overrides[real_get_current_user_id] = _mock_get_current_user_id
-app.dependency_overrides[real_get_uid_from_mcp_api_key] = _mock_get_uid_from_mcp_api_key
-print("🔧 FastAPI dependency overrides applied for all auth entrypoints")
+app.dependency_overrides[real_get_current_user_id] = mock_get_current_user_uid
+app.dependency_overrides[real_get_uid_from_mcp_api_key] = mock_get_current_user_uid
+log.info("🔧 FastAPI dependency overrides applied for all auth entrypoints")
 
 # Include core routers for Bluetooth device functionality
-print("🔌 Setting up core routers...")
+log.info("🔌 Setting up core routers...")
 app.include_router(transcribe.router)      # WebSocket transcription
 app.include_router(conversations.router)   # Conversation storage
 app.include_router(memories.router)        # Memory storage
@@ -97,14 +98,14 @@ app.include_router(apps.router)            # Apps endpoints
 # Create necessary directories
 paths = ['_temp', '_samples', '_segments', '_speech_profiles']
 for path in paths:
-    if not os.path.exists(path):
-        os.makedirs(path)
+    os.makedirs(path, exist_ok=True)
 
-print("📁 Directories created")
+log.info("📁 Directories created")
 
-@app.get("/")
-def read_root():
-    return {
+# Bodies of the constant endpoints are encoded once; the handlers return the bytes as-is, skipping
+# jsonable_encoder and JSON encoding per request.
+_ROOT_BODY = orjson.dumps(
+    {
         "message": "🚀 Taya Backend - Supabase No Auth DEPLOYED!",
         "status": "healthy",
         "version": "3.0.1",
@@ -124,6 +125,25 @@ def read_root():
             "/v1/conversations-noauth"
         ]
     }
+)
+_HEALTH_BODY = orjson.dumps(
+    {
+        "status": "healthy",
+        "auth_disabled": True,
+        "mock_user": MOCK_USER_ID,
+        "database": "supabase",
+        "supabase_connected": bool(SUPABASE_URL and SUPABASE_ANON_KEY)
+    }
+)
+_HEALTH_V1_BODY = orjson.dumps({"status": "ok", "database": "supabase"})
+_TEST_DEPLOYMENT_BODY = orjson.dumps(
+    {"message": "Supabase no-auth deployment is working!", "file": "main_noauth.py", "version": "3.1.0"}
+)
+
+
+@app.get("/", response_class=Response)
+async def read_root():
+    return Response(_ROOT_BODY, media_type="application/json")
 
 @app.get("/v1/users/profile-noauth")
 def get_user_profile_noauth():
@@ -169,26 +189,21 @@ def get_conversations_noauth():
             "message": "Conversations function working but may need database setup"
         }
 
-@app.get("/health")
-def health_check():
-    return {
-        "status": "healthy",
-        "auth_disabled": True,
-        "mock_user": MOCK_USER_ID,
-        "database": "supabase",
-        "supabase_connected": bool(SUPABASE_URL and SUPABASE_ANON_KEY)
-    }
+@app.get("/health", response_class=Response)
+async def health_check():
+    return Response(_HEALTH_BODY, media_type="application/json")
 
-@app.get("/v1/health")
-def health_check_v1():
-    return {"status": "ok", "database": "supabase"}
+@app.get("/v1/health", response_class=Response)
+async def health_check_v1():
+    return Response(_HEALTH_V1_BODY, media_type="application/json")
 
-print("🎉 Taya Backend - Supabase No Auth - Ready!")
+log.info("🎉 Taya Backend - Supabase No Auth - Ready!")
 
-@app.get("/test-deployment-working")
-def test_deployment():
-    return {"message": "Supabase no-auth deployment is working!", "file": "main_noauth.py", "version": "3.1.0"}
+@app.get("/test-deployment-working", response_class=Response)
+async def test_deployment():
+    return Response(_TEST_DEPLOYMENT_BODY, media_type="application/json")
 
 if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=int(os.environ.get("PORT", 8080)))
\ No newline at end of file
+    from utils.other.server import serve
+
+    serve(app, "main_noauth:app", log_level="warning", access_log=False)
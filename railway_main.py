@@ -1,73 +1,55 @@
-import json
+import importlib
 import os
-import firebase_admin
+from contextlib import asynccontextmanager
+
+import orjson
 from fastapi import FastAPI
-from routers import (
-    workflow,
-    chat,
-    firmware,
-    plugins,
-    transcribe,
-    notifications,
-    speech_profile,
-    agents,
-    users,
-    trends,
-    sync,
-    apps,
-    custom_auth,
-    payment,
-    integration,
-    conversations,
-    memories,
-    mcp,
-    oauth,
-    auth,
-    action_items,
-    other,
-)
+from fastapi.responses import ORJSONResponse, Response
+from database._client import init_firebase
+from utils.other.compression import JSONGZipMiddleware
 from utils.other.timeout import TimeoutMiddleware
 
-# Initialize Firebase
-if not firebase_admin._apps:
-    if os.environ.get('SERVICE_ACCOUNT_JSON'):
-        service_account_info = json.loads(os.environ["SERVICE_ACCOUNT_JSON"])
-        credentials = firebase_admin.credentials.Certificate(service_account_info)
-        firebase_admin.initialize_app(credentials)
-    elif os.environ.get('GOOGLE_APPLICATION_CREDENTIALS_BASE64'):
-        # Decode base64 service account for Railway
-        import base64
-        service_account_info = json.loads(base64.b64decode(os.environ["GOOGLE_APPLICATION_CREDENTIALS_BASE64"]).decode())
-        credentials = firebase_admin.credentials.Certificate(service_account_info)
-        firebase_admin.initialize_app(credentials)
-    else:
-        firebase_admin.initialize_app()
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Supabase deployments skip Firebase in database._client, so it is set up here before the first request. On
+    # Firestore the database._client import above has already initialized it and this call is a no-op.
+    init_firebase()
+    yield
 
-# Include all routers
-app.include_router(transcribe.router)
-app.include_router(conversations.router)
-app.include_router(action_items.router)
-app.include_router(memories.router)
-app.include_router(chat.router)
-app.include_router(plugins.router)
-app.include_router(speech_profile.router)
-app.include_router(notifications.router)
-app.include_router(workflow.router)
-app.include_router(integration.router)
-app.include_router(agents.router)
-app.include_router(users.router)
-app.include_router(trends.router)
-app.include_router(other.router)
-app.include_router(firmware.router)
-app.include_router(sync.router)
-app.include_router(apps.router)
-app.include_router(custom_auth.router)
-app.include_router(oauth.router)
-app.include_router(auth.router)
-app.include_router(payment.router)
-app.include_router(mcp.router)
+
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
+
+# Include all routers, in registration order. Routers listed in DISABLED_ROUTERS (comma-separated module names)
+# are never imported, which keeps their dependencies off the import path of deployments that don't serve them.
+ROUTER_NAMES = (
+    'transcribe',
+    'conversations',
+    'action_items',
+    'memories',
+    'chat',
+    'plugins',
+    'speech_profile',
+    'notifications',
+    'workflow',
+    'integration',
+    'agents',
+    'users',
+    'trends',
+    'other',
+    'firmware',
+    'sync',
+    'apps',
+    'custom_auth',
+    'oauth',
+    'auth',
+    'payment',
+    'mcp',
+)
+_disabled_routers = {name.strip() for name in os.environ.get('DISABLED_ROUTERS', '').split(',') if name.strip()}
+for router_name in ROUTER_NAMES:
+    if router_name not in _disabled_routers:
+        app.include_router(importlib.import_module(f'routers.{router_name}').router)
 
 # Add timeout middleware
 methods_timeout = {
@@ -78,21 +60,26 @@ methods_timeout = {
 }
 
 app.add_middleware(TimeoutMiddleware, methods_timeout=methods_timeout)
+app.add_middleware(JSONGZipMiddleware, minimum_size=1024, compresslevel=6)
 
 # Create necessary directories
 paths = ['_temp', '_samples', '_segments', '_speech_profiles']
 for path in paths:
-    if not os.path.exists(path):
-        os.makedirs(path)
+    os.makedirs(path, exist_ok=True)
+
+# Both bodies are constant, so they are encoded once instead of on every probe
+_ROOT_BODY = orjson.dumps({"message": "Taya Backend API is running!"})
+_HEALTH_BODY = orjson.dumps({"status": "healthy"})
 
-@app.get("/")
-def read_root():
-    return {"message": "Taya Backend API is running!"}
+@app.get("/", response_class=Response)
+async def read_root():
+    return Response(_ROOT_BODY, media_type="application/json")
 
-@app.get("/health")
-def health_check():
-    return {"status": "healthy"}
+@app.get("/health", response_class=Response)
+async def health_check():
+    return Response(_HEALTH_BODY, media_type="application/json")
 
 if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=int(os.environ.get("PORT", 8080)))
\ No newline at end of file
+    from utils.other.server import serve
+
+    serve(app, "railway_main:app", access_log=False)
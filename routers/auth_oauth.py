@@ -1,13 +1,12 @@
-from fastapi import APIRouter, HTTPException, Request, Response
-from fastapi.responses import RedirectResponse
+import asyncio
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import ORJSONResponse
+import httpx
 import os
-from google.auth.transport.requests import Request as GoogleRequest
-from google_auth_oauthlib.flow import Flow
 import secrets
 from utils.redis_client import redis_client
-import json
 
-router = APIRouter(prefix="/auth", tags=["authentication"])
+router = APIRouter(prefix="/auth", tags=["authentication"], default_response_class=ORJSONResponse)
 
 # OAuth Configuration
 GOOGLE_CLIENT_ID = os.getenv("GOOGLE_CLIENT_ID")
@@ -20,28 +19,44 @@ SCOPES = [
     'https://www.googleapis.com/auth/userinfo.profile'
 ]
 
+# Shared async client so the userinfo lookup reuses pooled connections and never blocks the event loop
+_http_client = httpx.AsyncClient(timeout=5.0)
+
+# Built once; a Flow keeps the fetched credentials, so only its config is shared between requests
+_GOOGLE_CLIENT_CONFIG = {
+    "web": {
+        "client_id": GOOGLE_CLIENT_ID,
+        "client_secret": GOOGLE_CLIENT_SECRET,
+        "auth_uri": "https://accounts.google.com/o/oauth2/auth",
+        "token_uri": "https://oauth2.googleapis.com/token",
+        "redirect_uris": [GOOGLE_REDIRECT_URI]
+    }
+}
+
 def create_google_oauth_flow():
     """Create Google OAuth flow"""
     if not GOOGLE_CLIENT_ID or not GOOGLE_CLIENT_SECRET:
         raise HTTPException(status_code=500, detail="Google OAuth not configured")
 
-    client_config = {
-        "web": {
-            "client_id": GOOGLE_CLIENT_ID,
-            "client_secret": GOOGLE_CLIENT_SECRET,
-            "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-            "token_uri": "https://oauth2.googleapis.com/token",
-            "redirect_uris": [GOOGLE_REDIRECT_URI]
-        }
-    }
+    # Imported on first use so deployments without Google OAuth never load google-auth/oauthlib
+    from google_auth_oauthlib.flow import Flow
 
     flow = Flow.from_client_config(
-        client_config,
+        _GOOGLE_CLIENT_CONFIG,
         scopes=SCOPES,
         redirect_uri=GOOGLE_REDIRECT_URI
     )
     return flow
 
+def _exchange_code_for_credentials(flow, authorization_code: str):
+    """Token exchange and refresh go through google-auth's sync transport, so this runs off the event loop"""
+    from google.auth.transport.requests import Request as GoogleRequest
+
+    flow.fetch_token(code=authorization_code)
+    credentials = flow.credentials
+    credentials.refresh(GoogleRequest())
+    return credentials
+
 @router.get("/google/login")
 async def google_login():
     """Initiate Google OAuth login"""
@@ -86,25 +101,18 @@ async def google_callback(request: Request):
         if not authorization_code or not state:
             raise HTTPException(status_code=400, detail="Missing authorization code or state")
 
-        # Verify state parameter
+        # Verify state parameter; GETDEL consumes it in the same round trip
         if redis_client.is_available():
-            stored_state = redis_client.get(f"oauth_state:{state}")
+            stored_state = redis_client.getdel(f"oauth_state:{state}")
             if not stored_state:
                 raise HTTPException(status_code=400, detail="Invalid or expired state parameter")
-            redis_client.delete(f"oauth_state:{state}")
 
         # Exchange authorization code for tokens
         flow = create_google_oauth_flow()
-        flow.fetch_token(code=authorization_code)
-
-        # Get user info from Google
-        credentials = flow.credentials
-        user_info_request = GoogleRequest()
-        credentials.refresh(user_info_request)
+        credentials = await asyncio.to_thread(_exchange_code_for_credentials, flow, authorization_code)
 
         # Get user profile info
-        import requests
-        user_info_response = requests.get(
+        user_info_response = await _http_client.get(
             'https://www.googleapis.com/oauth2/v2/userinfo',
             headers={'Authorization': f'Bearer {credentials.token}'}
         )
@@ -178,15 +186,18 @@ async def logout(request: Request):
 
     return {"message": "Logged out successfully"}
 
+# Everything the status reports is fixed once the module and the Redis client are initialised
+_AUTH_STATUS = {
+    "google_oauth": {
+        "configured": bool(GOOGLE_CLIENT_ID and GOOGLE_CLIENT_SECRET),
+        "client_id_present": bool(GOOGLE_CLIENT_ID),
+        "redirect_uri": GOOGLE_REDIRECT_URI
+    },
+    "redis_available": redis_client.is_available(),
+    "scopes": SCOPES
+}
+
 @router.get("/status")
 async def auth_status():
     """Check OAuth configuration status"""
-    return {
-        "google_oauth": {
-            "configured": bool(GOOGLE_CLIENT_ID and GOOGLE_CLIENT_SECRET),
-            "client_id_present": bool(GOOGLE_CLIENT_ID),
-            "redirect_uri": GOOGLE_REDIRECT_URI
-        },
-        "redis_available": redis_client.is_available(),
-        "scopes": SCOPES
-    }
\ No newline at end of file
+    return _AUTH_STATUS
\ No newline at end of file
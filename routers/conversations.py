@@ -199,7 +199,7 @@ def set_action_item_status(
 
     # Mirror status updates to the standalone action_items collection
     try:
-        existing_items = action_items_db.get_action_items_by_conversation(uid, conversation_id)
+        existing_items = action_items_db.get_action_items_by_conversation(uid, conversation_id, fields=['description'])
         # Map descriptions to item IDs for quick lookup
         description_to_ids = {}
         for ai in existing_items:
@@ -208,15 +208,17 @@ def set_action_item_status(
                 continue
             description_to_ids.setdefault(desc, []).append(ai['id'])
 
+        now = datetime.now(timezone.utc)
+        updates = {}
         for i, action_item_idx in enumerate(data.items_idx):
             if action_item_idx >= len(action_items):
                 continue
             action_item = action_items[action_item_idx]
-            new_completed_status = data.values[i]
+            completed = bool(data.values[i])
 
-            ids = description_to_ids.get(action_item.description, [])
-            for action_item_id in ids:
-                action_items_db.mark_action_item_completed(uid, action_item_id, bool(new_completed_status))
+            for action_item_id in description_to_ids.get(action_item.description, []):
+                updates[action_item_id] = {'completed': completed, 'completed_at': now if completed else None}
+        action_items_db.bulk_update_action_items(uid, updates)
     except Exception as e:
         # Don't break conversation route if mirrored update fails
         print('Failed to mirror action item status update:', e)
@@ -249,10 +251,15 @@ def update_action_item_description(
 
     # Mirror description update in the standalone action_items collection
     try:
-        existing_items = action_items_db.get_action_items_by_conversation(uid, conversation_id)
-        for ai in existing_items:
-            if ai.get('description') == data.old_description:
-                action_items_db.update_action_item(uid, ai['id'], {'description': data.description})
+        existing_items = action_items_db.get_action_items_by_conversation(uid, conversation_id, fields=['description'])
+        action_items_db.bulk_update_action_items(
+            uid,
+            {
+                ai['id']: {'description': data.description}
+                for ai in existing_items
+                if ai.get('description') == data.old_description
+            },
+        )
     except Exception as e:
         print('Failed to mirror action item description update:', e)
     return {"status": "Ok"}
@@ -270,10 +277,10 @@ def delete_action_item(data: DeleteActionItemRequest, conversation_id: str, uid=
 
     # Mirror deletion in the standalone action_items collection
     try:
-        existing_items = action_items_db.get_action_items_by_conversation(uid, conversation_id)
-        for ai in existing_items:
-            if ai.get('description') == data.description:
-                action_items_db.delete_action_item(uid, ai['id'])
+        existing_items = action_items_db.get_action_items_by_conversation(uid, conversation_id, fields=['description'])
+        action_items_db.bulk_delete_action_items(
+            uid, [ai['id'] for ai in existing_items if ai.get('description') == data.description]
+        )
     except Exception as e:
         print('Failed to mirror action item deletion:', e)
     return {"status": "Ok"}
@@ -1,3 +1,4 @@
+import asyncio
 import threading
 from typing import List
 
@@ -6,7 +7,7 @@ from fastapi import APIRouter, Depends, HTTPException
 import database.memories as memories_db
 from models.memories import MemoryDB, Memory, MemoryCategory
 from utils.apps import update_personas_async
-from utils.llm.memories import identify_category_for_memory
+from utils.llm.memories import identify_category_for_memory_async
 from utils.other import endpoints as auth
 
 router = APIRouter()
@@ -24,12 +25,12 @@ def _validate_memory(uid: str, memory_id: str) -> dict:
 
 
 @router.post('/v3/memories', tags=['memories'], response_model=MemoryDB)
-def create_memory(memory: Memory, uid: str = Depends(auth.get_current_user_uid)):
+async def create_memory(memory: Memory, uid: str = Depends(auth.get_current_user_uid)):
     # Only use the two primary categories for new memories
     categories = [MemoryCategory.interesting.value, MemoryCategory.system.value]
-    memory.category = identify_category_for_memory(memory.content, categories)
+    memory.category = await identify_category_for_memory_async(memory.content, categories)
     memory_db = MemoryDB.from_memory(memory, uid, None, True)
-    memories_db.create_memory(uid, memory_db.dict())
+    await asyncio.to_thread(memories_db.create_memory, uid, memory_db.dict())
     threading.Thread(target=update_personas_async, args=(uid,)).start()
     return memory_db
 
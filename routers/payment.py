@@ -1,3 +1,4 @@
+import asyncio
 from fastapi import Request, Header, HTTPException, APIRouter, Depends, Query
 import stripe
 from pydantic import BaseModel
@@ -188,6 +189,13 @@ def get_available_plans_endpoint(uid: str = Depends(auth.get_current_user_uid)):
         raise HTTPException(status_code=500, detail="Failed to fetch available plans")
 
 
+def _unlock_all_content(uid: str):
+    # Blocking database writes with retry backoff; the webhook runs them off the event loop
+    conversations_db.unlock_all_conversations(uid)
+    memories_db.unlock_all_memories(uid)
+    action_items_db.unlock_all_action_items(uid)
+
+
 @router.post('/v1/payments/checkout-session')
 def create_checkout_session_endpoint(request: CreateCheckoutRequest, uid: str = Depends(auth.get_current_user_uid)):
     # Check if user can make a new payment
@@ -396,9 +404,7 @@ async def stripe_webhook(request: Request, stripe_signature: str = Header(None))
             _update_subscription_from_session(client_reference_id, session)
             subscription = users_db.get_user_subscription(client_reference_id)
             if subscription and subscription.plan == PlanType.unlimited:
-                conversations_db.unlock_all_conversations(client_reference_id)
-                memories_db.unlock_all_memories(client_reference_id)
-                action_items_db.unlock_all_action_items(client_reference_id)
+                await asyncio.to_thread(_unlock_all_content, client_reference_id)
             subscription_id = session.get('subscription')
             if subscription_id:
                 try:
@@ -441,9 +447,7 @@ async def stripe_webhook(request: Request, stripe_signature: str = Header(None))
             new_subscription = _build_subscription_from_stripe_object(subscription_obj)
             if new_subscription:
                 if new_subscription.status == SubscriptionStatus.active and new_subscription.plan == PlanType.unlimited:
-                    conversations_db.unlock_all_conversations(uid)
-                    memories_db.unlock_all_memories(uid)
-                    action_items_db.unlock_all_action_items(uid)
+                    await asyncio.to_thread(_unlock_all_content, uid)
                 users_db.update_user_subscription(uid, new_subscription.dict())
                 print(f"Subscription for user {uid} updated from webhook event: {event['type']}.")
 
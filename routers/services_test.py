@@ -1,42 +1,64 @@
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
 from typing import Dict, Any
 import asyncio
 from utils.redis_client import redis_client
 from utils.pinecone_client import pinecone_client
-
-router = APIRouter(prefix="/services", tags=["services"])
+from utils.other.service_probes import probe_services
+
+router = APIRouter(prefix="/services", tags=["services"], default_response_class=ORJSONResponse)
+
+# Fixed 1536-dim (OpenAI embedding size) vectors for the memory round-trip test, built once at import
+_TEST_MEMORY_EMBEDDINGS = {
+    "mem-001": [0.1 + i*0.01 for i in range(1536)],
+    "mem-002": [0.2 + i*0.01 for i in range(1536)],
+}
+_TEST_SEARCH_EMBEDDING = [0.15 + i*0.01 for i in range(1536)]  # Similar to first memory
+
+async def _wait_indexed(ids, timeout: float = 1.0) -> bool:
+    """Poll until all vectors are fetchable, backing off from 50ms; gives up after timeout seconds"""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    delay = 0.05
+    while loop.time() < deadline:
+        found = await asyncio.to_thread(pinecone_client.fetch_vectors, ids)
+        if len(found) == len(ids):
+            return True
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, 0.2)
+    return False
 
 @router.get("/health")
 async def services_health():
     """Check the health of all external services"""
+    probes = await probe_services()
     health_status = {
         "redis": {
-            "available": redis_client.is_available(),
+            "available": probes.redis_available,
             "status": "unknown"
         },
         "pinecone": {
-            "available": pinecone_client.is_available(),
+            "available": probes.pinecone_available,
             "status": "unknown"
         }
     }
 
     # Test Redis connection
-    if redis_client.is_available():
-        try:
-            redis_ping = redis_client.ping()
-            health_status["redis"]["status"] = "healthy" if redis_ping else "unhealthy"
-        except Exception as e:
-            health_status["redis"]["status"] = f"error: {str(e)}"
+    if probes.redis_available:
+        if isinstance(probes.redis_ping, Exception):
+            health_status["redis"]["status"] = f"error: {str(probes.redis_ping)}"
+        else:
+            health_status["redis"]["status"] = "healthy" if probes.redis_ping else "unhealthy"
 
     # Test Pinecone connection
-    if pinecone_client.is_available():
-        try:
-            stats = pinecone_client.get_stats()
+    if probes.pinecone_available:
+        stats = probes.pinecone_stats
+        if isinstance(stats, Exception):
+            health_status["pinecone"]["status"] = f"error: {str(stats)}"
+        else:
             health_status["pinecone"]["status"] = "healthy" if stats else "unhealthy"
             if stats:
                 health_status["pinecone"]["stats"] = stats
-        except Exception as e:
-            health_status["pinecone"]["status"] = f"error: {str(e)}"
 
     return health_status
 
@@ -78,7 +100,7 @@ async def test_redis():
 @router.post("/pinecone/test")
 async def test_pinecone():
     """Test Pinecone operations"""
-    if not pinecone_client.is_available():
+    if not await pinecone_client.is_available_async():
         raise HTTPException(status_code=503, detail="Pinecone not available")
 
     try:
@@ -88,14 +110,14 @@ async def test_pinecone():
         test_metadata = {"text": "This is a test vector", "user_id": "test-user"}
 
         # Test UPSERT
-        upsert_result = pinecone_client.upsert_vectors([{
+        upsert_result = await pinecone_client.upsert_vectors_async([{
             "id": test_id,
             "values": test_vector,
             "metadata": test_metadata
         }])
 
-        # Small delay to allow indexing
-        await asyncio.sleep(1)
+        # Wait until the vector is indexed, at most one second
+        await _wait_indexed([test_id])
 
         # Test QUERY
         query_results = pinecone_client.query_vectors(
@@ -129,7 +151,7 @@ async def test_pinecone():
 @router.post("/memory/test")
 async def test_memory_operations():
     """Test memory storage and retrieval (combining both services)"""
-    if not pinecone_client.is_available():
+    if not await pinecone_client.is_available_async():
         raise HTTPException(status_code=503, detail="Pinecone not available")
 
     try:
@@ -138,36 +160,28 @@ async def test_memory_operations():
             {
                 "id": "mem-001",
                 "text": "I had coffee with John this morning",
-                "embedding": [0.1 + i*0.01 for i in range(1536)],
+                "embedding": _TEST_MEMORY_EMBEDDINGS["mem-001"],
                 "user_id": "user-123"
             },
             {
                 "id": "mem-002",
                 "text": "Meeting scheduled for next week",
-                "embedding": [0.2 + i*0.01 for i in range(1536)],
+                "embedding": _TEST_MEMORY_EMBEDDINGS["mem-002"],
                 "user_id": "user-123"
             }
         ]
 
-        # Store memories
-        store_results = []
-        for memory in test_memories:
-            result = pinecone_client.upsert_memory(
-                memory_id=memory["id"],
-                embedding=memory["embedding"],
-                text=memory["text"],
-                user_id=memory["user_id"],
-                metadata={"created": "2024-01-01"}
-            )
-            store_results.append(result)
-
-        # Small delay for indexing
-        await asyncio.sleep(1)
+        # Store memories in one request
+        store_results = pinecone_client.upsert_memories(
+            [{**memory, "metadata": {"created": "2024-01-01"}} for memory in test_memories]
+        )
+
+        # Wait until the memories are indexed, at most one second
+        await _wait_indexed([mem["id"] for mem in test_memories])
 
         # Search memories
-        search_query = [0.15 + i*0.01 for i in range(1536)]  # Similar to first memory
         search_results = pinecone_client.search_memories(
-            query_embedding=search_query,
+            query_embedding=_TEST_SEARCH_EMBEDDING,
             user_id="user-123",
             top_k=5
         )
@@ -1,8 +1,10 @@
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
 from utils.redis_client import redis_client
 from utils.pinecone_client import pinecone_client
+from utils.other.service_probes import probe_services
 
-router = APIRouter(prefix="/test", tags=["test"])
+router = APIRouter(prefix="/test", tags=["test"], default_response_class=ORJSONResponse)
 
 @router.get("/redis")
 async def test_redis_simple():
@@ -24,7 +26,7 @@ async def test_redis_simple():
 @router.get("/pinecone")
 async def test_pinecone_simple():
     """Simple Pinecone test"""
-    if not pinecone_client.is_available():
+    if not await pinecone_client.is_available_async():
         return {"status": "Pinecone not configured"}
 
     try:
@@ -41,22 +43,22 @@ async def test_pinecone_simple():
 @router.get("/all")
 async def test_all_simple():
     """Test all services simply"""
+    probes = await probe_services()
     results = {
-        "redis": {"available": redis_client.is_available()},
-        "pinecone": {"available": pinecone_client.is_available()}
+        "redis": {"available": probes.redis_available},
+        "pinecone": {"available": probes.pinecone_available}
     }
 
-    if redis_client.is_available():
-        try:
-            results["redis"]["ping"] = redis_client.ping()
-        except Exception as e:
-            results["redis"]["error"] = str(e)
+    if probes.redis_available:
+        if isinstance(probes.redis_ping, Exception):
+            results["redis"]["error"] = str(probes.redis_ping)
+        else:
+            results["redis"]["ping"] = probes.redis_ping
 
-    if pinecone_client.is_available():
-        try:
-            stats = pinecone_client.get_stats()
-            results["pinecone"]["has_stats"] = stats is not None
-        except Exception as e:
-            results["pinecone"]["error"] = str(e)
+    if probes.pinecone_available:
+        if isinstance(probes.pinecone_stats, Exception):
+            results["pinecone"]["error"] = str(probes.pinecone_stats)
+        else:
+            results["pinecone"]["has_stats"] = probes.pinecone_stats is not None
 
-    return results
\ No newline at end of file
+    return results
@@ -1,4 +1,5 @@
 import os
+import shutil
 from typing import Optional
 
 from fastapi import APIRouter, UploadFile, Depends, HTTPException
@@ -51,7 +52,7 @@ def upload_profile(file: UploadFile, uid: str = Depends(auth.get_current_user_ui
     os.makedirs(f'_temp/{uid}', exist_ok=True)
     file_path = f"_temp/{uid}/{file.filename}"
     with open(file_path, 'wb') as f:
-        f.write(file.file.read())
+        shutil.copyfileobj(file.file, f)
 
     aseg = AudioSegment.from_wav(file_path)
     if aseg.frame_rate != 16000:
@@ -8,6 +8,7 @@ from enum import Enum
 from typing import Dict, List, Optional, Set, Tuple
 
 import opuslib
+import orjson
 import webrtcvad
 from fastapi import APIRouter, Depends
 from fastapi.websockets import WebSocket, WebSocketDisconnect
@@ -205,7 +206,7 @@ async def _listen(
         if not websocket_active:
             return False
         try:
-            await websocket.send_json(msg.to_json())
+            await websocket.send_text(orjson.dumps(msg.to_json()).decode())
             return True
         except WebSocketDisconnect:
             print("WebSocket disconnected", uid, session_id)
@@ -825,7 +826,7 @@ async def _listen(
                     TranscriptSegment(**s, speech_profile_processed=speech_profile_processed)
                     for s in segments_to_process
                 ]
-                words_transcribed = len(" ".join([seg.text for seg in newly_processed_segments]).split())
+                words_transcribed = sum(len(seg.text.split()) for seg in newly_processed_segments)
                 if words_transcribed > 0:
                     words_transcribed_since_last_record += words_transcribed
 
@@ -844,7 +845,7 @@ async def _listen(
                     updates_segments = [segment.dict() for segment in conversation.transcript_segments[starts:ends]]
                 else:
                     updates_segments = [segment.dict() for segment in transcript_segments]
-                await websocket.send_json(updates_segments)
+                await websocket.send_text(orjson.dumps(updates_segments).decode())
 
                 if transcript_send is not None:
                     transcript_send([segment.dict() for segment in transcript_segments], current_conversation_id)
@@ -945,16 +946,17 @@ async def _listen(
                 message = await websocket.receive()
                 last_audio_received_time = time.time()
 
-                if message.get("bytes") is not None:
+                # Read each frame's payload once and reuse the receive timestamp for the STT routing below
+                data = message.get("bytes")
+                if data is not None:
                     if first_audio_byte_timestamp is None:
                         first_audio_byte_timestamp = last_audio_received_time
                         last_usage_record_timestamp = first_audio_byte_timestamp
-                    data = message.get("bytes")
+                    elapsed_seconds = last_audio_received_time - timer_start
                     if codec == 'opus' and sample_rate == 16000:
                         data = decoder.decode(bytes(data), frame_size=frame_size)
 
                     if soniox_socket is not None:
-                        elapsed_seconds = time.time() - timer_start
                         if elapsed_seconds > speech_profile_duration or not soniox_socket2:
                             await soniox_socket.send(data)
                             if soniox_socket2:
@@ -969,7 +971,6 @@ async def _listen(
                         await speechmatics_socket1.send(data)
 
                     if dg_socket1 is not None:
-                        elapsed_seconds = time.time() - timer_start
                         if elapsed_seconds > speech_profile_duration or not dg_socket2:
                             dg_socket1.send(data)
                             if dg_socket2:
@@ -983,9 +984,9 @@ async def _listen(
                     if audio_bytes_send is not None:
                         audio_bytes_send(data)
 
-                elif message.get("text") is not None:
+                elif (text := message.get("text")) is not None:
                     try:
-                        json_data = json.loads(message.get("text"))
+                        json_data = json.loads(text)
                         if json_data.get('type') == 'image_chunk':
                             await handle_image_chunk(
                                 uid, json_data, image_chunks, _asend_message_event, realtime_photo_buffers
@@ -1020,7 +1021,7 @@ async def _listen(
                                     session_id,
                                 )
                     except json.JSONDecodeError:
-                        print(f"Received non-json text message: {message.get('text')}", uid, session_id)
+                        print(f"Received non-json text message: {text}", uid, session_id)
 
         except WebSocketDisconnect:
             print("WebSocket disconnected", uid, session_id)
@@ -7,12 +7,17 @@ import os
 import base64
 import json
 
+# Service account decoded from GOOGLE_APPLICATION_CREDENTIALS_BASE64, kept so clients don't parse it again
+SERVICE_ACCOUNT_INFO = None
+
 
 def setup_google_cloud_credentials():
     """
     Sets up Google Cloud credentials from base64 environment variable.
     Should be called before any Google Cloud service initialization.
     """
+    global SERVICE_ACCOUNT_INFO
+
     if os.environ.get('SERVICE_ACCOUNT_JSON'):
         print("✅ SERVICE_ACCOUNT_JSON already set")
         return True
@@ -31,6 +36,8 @@ def setup_google_cloud_credentials():
         if 'project_id' not in parsed:
             raise ValueError("Invalid service account JSON - missing project_id")
 
+        SERVICE_ACCOUNT_INFO = parsed
+
         # Set both environment variables for different auth methods
         os.environ['SERVICE_ACCOUNT_JSON'] = credentials_json
 
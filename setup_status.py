@@ -5,23 +5,19 @@ Based on: https://docs.omi.me/doc/developer/backend/Backend_Setup
 """
 
 import os
-import subprocess
+import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
 load_dotenv()
 
-def check_command(cmd):
-    """Check if a command is available"""
-    try:
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-        return result.returncode == 0
-    except:
-        return False
+def check_command(binary):
+    """Check if a command is available on PATH (a lookup only, nothing is spawned)"""
+    return shutil.which(binary) is not None
 
-def get_env_status(key):
+def get_env_status(value):
     """Check environment variable status"""
-    value = os.getenv(key)
     if not value:
         return "❌ Missing"
     elif value and len(value) > 20:
@@ -36,12 +32,12 @@ def main():
 
     print("\n📋 CORE REQUIREMENTS:")
     requirements = {
-        "Python": check_command("python3 --version"),
-        "pip": check_command("pip --version"),
-        "Git": check_command("git --version"),
-        "FFmpeg": check_command("ffmpeg -version"),
-        "Google Cloud SDK": check_command("gcloud --version"),
-        "Ngrok": check_command("ngrok version"),
+        "Python": check_command("python3"),
+        "pip": check_command("pip"),
+        "Git": check_command("git"),
+        "FFmpeg": check_command("ffmpeg"),
+        "Google Cloud SDK": check_command("gcloud"),
+        "Ngrok": check_command("ngrok"),
     }
 
     for req, status in requirements.items():
@@ -59,8 +55,11 @@ def main():
         "Google Credentials": "GOOGLE_APPLICATION_CREDENTIALS"
     }
 
-    for service, env_var in api_keys.items():
-        status = get_env_status(env_var)
+    # Read each variable once; the status lines below work from this snapshot
+    api_values = {service: os.getenv(env_var) for service, env_var in api_keys.items()}
+
+    for service, value in api_values.items():
+        status = get_env_status(value)
         print(f"   {status} {service}")
 
     print("\n🛠️ OPTIONAL SERVICES:")
@@ -73,40 +72,55 @@ def main():
         "Stripe": "STRIPE_SECRET_KEY"
     }
 
-    for service, env_var in optional_keys.items():
-        status = get_env_status(env_var)
+    optional_values = {service: os.getenv(env_var) for service, env_var in optional_keys.items()}
+
+    for service, value in optional_values.items():
+        status = get_env_status(value)
         print(f"   {status} {service}")
 
     print("\n🏗️ INFRASTRUCTURE STATUS:")
     try:
         import requests
+        from requests.adapters import HTTPAdapter
+
+        # One keep-alive session shared by the four probes, which run side by side
+        session = requests.Session()
+        session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
+        def probe(path):
+            try:
+                return session.get(f"http://localhost:8080{path}", timeout=2)
+            except requests.RequestException:
+                return None
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            server_resp, redis_resp, pinecone_resp, oauth_resp = executor.map(
+                probe, ["/", "/test/redis", "/test/pinecone", "/auth/status"]
+            )
+
         # Test local server
-        try:
-            resp = requests.get("http://localhost:8080/", timeout=2)
-            server_status = "✅ Running" if resp.status_code == 200 else "❌ Error"
-        except:
+        if server_resp is None:
             server_status = "❌ Not running"
+        else:
+            server_status = "✅ Running" if server_resp.status_code == 200 else "❌ Error"
 
         # Test Redis
-        try:
-            resp = requests.get("http://localhost:8080/test/redis", timeout=2)
-            redis_status = "✅ Working" if resp.status_code == 200 else "❌ Error"
-        except:
+        if redis_resp is None:
             redis_status = "❌ Cannot test"
+        else:
+            redis_status = "✅ Working" if redis_resp.status_code == 200 else "❌ Error"
 
         # Test Pinecone
-        try:
-            resp = requests.get("http://localhost:8080/test/pinecone", timeout=2)
-            pinecone_status = "✅ Working" if resp.status_code == 200 else "❌ Error"
-        except:
+        if pinecone_resp is None:
             pinecone_status = "❌ Cannot test"
+        else:
+            pinecone_status = "✅ Working" if pinecone_resp.status_code == 200 else "❌ Error"
 
         # Test OAuth
-        try:
-            resp = requests.get("http://localhost:8080/auth/status", timeout=2)
-            oauth_status = "✅ Configured" if "configured\":true" in resp.text else "❌ Not configured"
-        except:
+        if oauth_resp is None:
             oauth_status = "❌ Cannot test"
+        else:
+            oauth_status = "✅ Configured" if "configured\":true" in oauth_resp.text else "❌ Not configured"
 
     except ImportError:
         server_status = redis_status = pinecone_status = oauth_status = "❓ Cannot test (requests not installed)"
@@ -120,7 +134,7 @@ def main():
     required_count = sum(1 for status in requirements.values() if status)
     required_total = len(requirements)
 
-    api_count = sum(1 for env_var in api_keys.values() if os.getenv(env_var))
+    api_count = sum(1 for value in api_values.values() if value)
     api_total = len(api_keys)
 
     print(f"   Core Requirements: {required_count}/{required_total}")
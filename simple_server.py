@@ -1,36 +1,39 @@
 #!/usr/bin/env python3
 
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 import json
+import logging
 import os
 
+log = logging.getLogger(__name__)
+
+# Responses never change while the process runs, so they are encoded once
+_ROOT_BODY = json.dumps({"message": "Taya Backend is working on Railway!", "status": "success"}).encode()
+_HEALTH_BODY = json.dumps({"status": "healthy", "port": os.environ.get("PORT", "8080")}).encode()
+_NOT_FOUND_BODY = json.dumps({"error": "Not found"}).encode()
+
 class SimpleHandler(BaseHTTPRequestHandler):
     def do_GET(self):
         if self.path == '/':
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            response = {"message": "Taya Backend is working on Railway!", "status": "success"}
-            self.wfile.write(json.dumps(response).encode())
+            self._send_json(200, _ROOT_BODY)
         elif self.path == '/health':
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            response = {"status": "healthy", "port": os.environ.get("PORT", "8080")}
-            self.wfile.write(json.dumps(response).encode())
+            self._send_json(200, _HEALTH_BODY)
         else:
-            self.send_response(404)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            response = {"error": "Not found"}
-            self.wfile.write(json.dumps(response).encode())
+            self._send_json(404, _NOT_FOUND_BODY)
+
+    def _send_json(self, status, body):
+        self.send_response(status)
+        self.send_header('Content-type', 'application/json')
+        self.end_headers()
+        self.wfile.write(body)
 
     def log_message(self, format, *args):
-        # Log to stdout for Railway to capture
-        print(f"{self.client_address[0]} - - [{self.log_date_time_string()}] {format % args}")
+        # Access lines go through logging so LOG_LEVEL=WARNING can silence them when request volume is high
+        log.info("%s - - " + format, self.client_address[0], *args)
 
 if __name__ == "__main__":
+    logging.basicConfig(level=os.environ.get("LOG_LEVEL", "INFO"))
     port = int(os.environ.get('PORT', 8080))
-    server = HTTPServer(('0.0.0.0', port), SimpleHandler)
+    server = ThreadingHTTPServer(('0.0.0.0', port), SimpleHandler)
     print(f"Starting server on port {port}")
     server.serve_forever()
\ No newline at end of file
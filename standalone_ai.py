@@ -4,22 +4,37 @@ Standalone AI processing functions without database dependencies
 from datetime import datetime, timezone
 from typing import List, Optional, Tuple
 from dataclasses import dataclass
+import itertools
+import logging
 import os
+import re
+
+logger = logging.getLogger(__name__)
+
+# Substring matches, case-insensitive: one regex scan in C instead of lowering and searching once per phrase
+_TEST_PHRASES_RE = re.compile(
+    "|".join(map(re.escape, ["test", "testing", "hello world", "mock", "sample"])), re.IGNORECASE
+)
+_ACTION_KEYWORDS_RE = re.compile(
+    "|".join(map(re.escape, ["todo", "task", "need to", "should", "must", "action", "follow up"])), re.IGNORECASE
+)
+_SENTENCE_RE = re.compile(r"[^.]+")
+_WORD_RE = re.compile(r"\S+")
 
 # Simplified models without database dependencies
-@dataclass
+@dataclass(slots=True)
 class ActionItem:
     description: str
     completed: bool = False
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     title: str
     description: str
     start: Optional[datetime] = None
     duration: Optional[int] = None
 
-@dataclass
+@dataclass(slots=True)
 class Structured:
     title: Optional[str] = None
     overview: Optional[str] = None
@@ -35,14 +50,12 @@ def should_discard_conversation(transcript: str) -> bool:
     if not transcript or len(transcript.strip()) < 10:
         return True
 
-    # Check for meaningful content
-    words = transcript.split()
-    if len(words) < 3:
+    # Check for meaningful content; three words are enough, so stop scanning there instead of splitting it all
+    if sum(1 for _ in itertools.islice(_WORD_RE.finditer(transcript), 3)) < 3:
         return True
 
     # Check for test/placeholder content
-    test_phrases = ["test", "testing", "hello world", "mock", "sample"]
-    if any(phrase in transcript.lower() for phrase in test_phrases):
+    if _TEST_PHRASES_RE.search(transcript):
         return True
 
     return False
@@ -57,19 +70,16 @@ def get_transcript_structure(transcript: str, started_at: datetime, language_cod
         # In production, this would use the actual LLM call
 
         # Extract potential action items (simple keyword detection)
-        action_items = []
-        action_keywords = ["todo", "task", "need to", "should", "must", "action", "follow up"]
-        sentences = transcript.split('.')
-
-        for sentence in sentences:
-            if any(keyword in sentence.lower() for keyword in action_keywords):
-                action_items.append(ActionItem(
-                    description=sentence.strip(),
-                    completed=False
-                ))
+        # Sentences are matched lazily rather than split into a list up front
+        action_items = [
+            ActionItem(description=match.group().strip(), completed=False)
+            for match in _SENTENCE_RE.finditer(transcript)
+            if _ACTION_KEYWORDS_RE.search(match.group())
+        ]
 
         # Generate simple title and overview
-        words = transcript.split()[:20]  # First 20 words
+        # Only the first six words are used, so stop scanning there instead of splitting the whole transcript
+        words = [m.group() for m in itertools.islice(_WORD_RE.finditer(transcript), 6)]
         title = f"Conversation on {started_at.strftime('%B %d')}"
         if len(words) > 5:
             title = f"Discussion about {' '.join(words[2:6])}"
@@ -86,7 +96,7 @@ def get_transcript_structure(transcript: str, started_at: datetime, language_cod
         )
 
     except Exception as e:
-        print(f"AI processing error: {e}")
+        logger.exception("AI processing error: %s", e)
         # Fallback to basic structure
         return Structured(
             title="New Conversation",
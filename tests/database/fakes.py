@@ -0,0 +1,96 @@
+"""In-memory stand-ins for the Firestore and PostgREST clients the database modules talk to"""
+
+
+class FakeSnapshot:
+    def __init__(self, doc_id, data):
+        self.id = doc_id
+        self._data = data
+        self.exists = data is not None
+        self.reference = doc_id
+
+    def to_dict(self):
+        return None if self._data is None else dict(self._data)
+
+
+class FakeFirestoreQuery:
+    """Any chain of collection/document/where/order_by/limit/offset calls ends in the same stored documents"""
+
+    def __init__(self, docs):
+        self.docs = docs
+        self.calls = []
+
+    def __getattr__(self, name):
+        def record(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+            return self
+
+        return record
+
+    def document(self, doc_id):
+        self.calls.append(('document', (doc_id,), {}))
+        self.doc_id = doc_id
+        return self
+
+    def get(self, **kwargs):
+        return FakeSnapshot(self.doc_id, self.docs.get(self.doc_id))
+
+    def stream(self):
+        return [FakeSnapshot(doc_id, data) for doc_id, data in self.docs.items()]
+
+
+class FakeResponse:
+    def __init__(self, data=None, count=None):
+        self.data = data
+        self.count = count
+
+
+class FakeSupabaseQuery:
+    def __init__(self, client, table, operation, payload=None):
+        self.client = client
+        self.table = table
+        self.operation = operation
+        self.payload = payload
+        self.filters = []
+
+    def __getattr__(self, name):
+        def record(*args, **kwargs):
+            self.filters.append((name, args))
+            return self
+
+        return record
+
+    def execute(self):
+        self.client.executed.append(self)
+        return self.client.responses.pop(0) if self.client.responses else FakeResponse([])
+
+
+class FakeSupabaseTable:
+    def __init__(self, client, name):
+        self.client = client
+        self.name = name
+
+    def select(self, *args, **kwargs):
+        return FakeSupabaseQuery(self.client, self.name, 'select', args)
+
+    def insert(self, payload, **kwargs):
+        return FakeSupabaseQuery(self.client, self.name, 'insert', payload)
+
+    def upsert(self, payload, **kwargs):
+        return FakeSupabaseQuery(self.client, self.name, 'upsert', payload)
+
+    def update(self, payload, **kwargs):
+        return FakeSupabaseQuery(self.client, self.name, 'update', payload)
+
+    def delete(self, **kwargs):
+        return FakeSupabaseQuery(self.client, self.name, 'delete')
+
+
+class FakeSupabase:
+    """Records every executed query; execute() hands out the queued responses in order"""
+
+    def __init__(self, responses=None):
+        self.responses = list(responses or [])
+        self.executed = []
+
+    def table(self, name):
+        return FakeSupabaseTable(self, name)
@@ -0,0 +1,50 @@
+import pytest
+
+from database import action_items as action_items_db
+from tests.database.fakes import FakeFirestoreQuery, FakeResponse, FakeSupabase
+
+
+@pytest.fixture
+def supabase_action_items(monkeypatch):
+    fake = FakeSupabase()
+    monkeypatch.setattr(action_items_db, 'get_supabase', lambda: fake)
+    return fake
+
+
+@pytest.fixture
+def firestore_action_items(monkeypatch):
+    docs = {}
+    monkeypatch.setattr(action_items_db, '_USE_SUPABASE', False)
+    monkeypatch.setattr(action_items_db, 'db', FakeFirestoreQuery(docs))
+    return docs
+
+
+def test_noop_update_of_missing_item_fails_on_supabase(supabase_action_items):
+    supabase_action_items.responses.append(FakeResponse([]))
+
+    assert action_items_db.update_action_item('uid-1', 'missing', {}) is False
+    (lookup,) = supabase_action_items.executed
+    assert lookup.operation == 'select'
+
+
+def test_noop_update_of_existing_item_skips_the_write_on_supabase(supabase_action_items):
+    supabase_action_items.responses.append(FakeResponse([{'id': 'a1'}]))
+
+    assert action_items_db.update_action_item('uid-1', 'a1', {'updated_at': None}) is True
+    assert [query.operation for query in supabase_action_items.executed] == ['select']
+
+
+def test_noop_update_checks_existence_on_firestore(firestore_action_items):
+    firestore_action_items['a1'] = {'description': 'ship it'}
+
+    assert action_items_db.update_action_item('uid-1', 'a1', {}) is True
+    assert action_items_db.update_action_item('uid-1', 'missing', {}) is False
+
+
+def test_backend_is_resolved_once_at_import(supabase_action_items, monkeypatch):
+    # Changing the environment after import must not move calls to another backend
+    monkeypatch.delenv('SUPABASE_URL')
+    supabase_action_items.responses.append(FakeResponse([{'id': 'a1'}]))
+
+    assert action_items_db.update_action_item('uid-1', 'a1', {}) is True
+    assert len(supabase_action_items.executed) == 1
@@ -0,0 +1,51 @@
+import firebase_admin
+from firebase_admin import credentials
+from google.cloud import firestore
+
+import setup_credentials
+from database import _client
+
+
+def test_firestore_db_uses_decoded_service_account(monkeypatch):
+    service_account = {'project_id': 'taya-test', 'client_email': 'svc@taya-test.iam.gserviceaccount.com'}
+    certificates = []
+    clients = []
+    monkeypatch.delenv('SUPABASE_URL', raising=False)
+    monkeypatch.setattr(setup_credentials, 'SERVICE_ACCOUNT_INFO', service_account)
+    monkeypatch.setattr(firebase_admin, '_apps', {})
+    monkeypatch.setattr(firebase_admin, 'initialize_app', lambda credential: None)
+    monkeypatch.setattr(credentials, 'Certificate', lambda info: certificates.append(info))
+    monkeypatch.setattr(
+        firestore.Client,
+        'from_service_account_info',
+        classmethod(lambda cls, info, database: clients.append((info, database)) or 'firestore-client'),
+    )
+    _client._build_db.cache_clear()
+    try:
+        assert _client._build_db() == 'firestore-client'
+    finally:
+        _client._build_db.cache_clear()
+
+    assert certificates == [service_account]
+    assert clients == [(service_account, '(default)')]
+
+
+def test_supabase_db_is_used_when_configured():
+    from database.supabase_client import db as supabase_db
+
+    _client._build_db.cache_clear()
+    try:
+        assert _client._build_db() is supabase_db
+    finally:
+        _client._build_db.cache_clear()
+
+
+def test_init_firebase_reuses_an_initialized_app(monkeypatch):
+    # railway_main's lifespan calls this after database._client may already have initialized Firebase
+    initialized = []
+    monkeypatch.setattr(setup_credentials, 'SERVICE_ACCOUNT_INFO', {'project_id': 'taya-test'})
+    monkeypatch.setattr(firebase_admin, '_apps', {'[DEFAULT]': object()})
+    monkeypatch.setattr(firebase_admin, 'initialize_app', lambda *args: initialized.append(args))
+
+    assert _client.init_firebase() == {'project_id': 'taya-test'}
+    assert initialized == []
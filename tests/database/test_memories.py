@@ -0,0 +1,106 @@
+import pytest
+from google.cloud import firestore
+from google.cloud.firestore_v1 import FieldFilter
+
+from database import memories as memories_db
+from tests.database.fakes import FakeFirestoreQuery, FakeResponse, FakeSupabase
+from utils import encryption
+
+
+@pytest.fixture
+def firestore_memories(monkeypatch):
+    """Runs memories_db against an in-memory Firestore; returns the stored documents keyed by id"""
+    docs = {}
+    monkeypatch.setattr(memories_db, '_USE_SUPABASE', False)
+    # The SDK is only imported when Firestore was the backend at import time
+    monkeypatch.setattr(memories_db, 'firestore', firestore, raising=False)
+    monkeypatch.setattr(memories_db, 'FieldFilter', FieldFilter, raising=False)
+    monkeypatch.setattr(memories_db, 'db', FakeFirestoreQuery(docs))
+    return docs
+
+
+def test_public_memories_include_documents_without_visibility(firestore_memories):
+    firestore_memories.update(
+        {
+            'legacy': {'id': 'legacy', 'content': 'written before visibility existed'},
+            'public': {'id': 'public', 'content': 'shared', 'visibility': 'public'},
+            'private': {'id': 'private', 'content': 'hidden', 'visibility': 'private'},
+        }
+    )
+
+    memories = memories_db.get_user_public_memories('uid-1')
+
+    assert [memory['id'] for memory in memories] == ['legacy', 'public']
+
+
+@pytest.fixture
+def supabase_memories(monkeypatch):
+    fake = FakeSupabase()
+    monkeypatch.setattr(memories_db, 'supabase', fake)
+    return fake
+
+
+def test_migrate_to_enhanced_updates_rows_in_place(supabase_memories):
+    supabase_memories.responses.append(
+        FakeResponse(
+            [
+                {'id': 'm1', 'content': 'first', 'data_protection_level': 'standard'},
+                {'id': 'm2', 'content': None, 'data_protection_level': 'standard'},
+                {'id': 'm3', 'content': 'done', 'data_protection_level': 'enhanced'},
+            ]
+        )
+    )
+
+    memories_db.migrate_memories_level_batch('uid-1', ['m1', 'm2', 'm3'], 'enhanced')
+
+    writes = supabase_memories.executed[1:]
+    # Partial rows must never go through INSERT ... ON CONFLICT, which checks NOT NULL columns first
+    assert [query.operation for query in writes] == ['update', 'update']
+    level_only, content = writes
+    assert level_only.payload == {'data_protection_level': 'enhanced'}
+    assert ('in_', ('id', ['m2'])) in level_only.filters
+    assert ('eq', ('id', 'm1')) in content.filters
+    # RLS only lets a user touch their own rows, so every write has to be scoped to the uid
+    assert all(('eq', ('uid', 'uid-1')) in query.filters for query in writes)
+    assert content.payload['data_protection_level'] == 'enhanced'
+    assert encryption.decrypt(content.payload['content'], 'uid-1') == 'first'
+
+
+def test_migrate_to_standard_only_changes_the_level(supabase_memories):
+    supabase_memories.responses.append(
+        FakeResponse([{'id': 'm1', 'content': 'cipher', 'data_protection_level': 'enhanced'}])
+    )
+
+    memories_db.migrate_memories_level_batch('uid-1', ['m1'], 'standard')
+
+    (update,) = supabase_memories.executed[1:]
+    assert update.operation == 'update'
+    assert update.table == 'memories'
+    assert update.payload == {'data_protection_level': 'standard'}
+    assert ('eq', ('uid', 'uid-1')) in update.filters
+
+
+def test_get_memory_reads_through_to_the_database(supabase_memories):
+    # Another worker may edit the row between two reads; the second read must not come from a local cache
+    supabase_memories.responses.extend(
+        [
+            FakeResponse({'id': 'm1', 'content': 'before', 'data_protection_level': 'standard'}),
+            FakeResponse({'id': 'm1', 'content': 'after', 'data_protection_level': 'standard'}),
+        ]
+    )
+
+    assert memories_db.get_memory('uid-1', 'm1')['content'] == 'before'
+    assert memories_db.get_memory(uid='uid-1', memory_id='m1')['content'] == 'after'
+
+
+def test_backend_is_resolved_once_at_import(supabase_memories, monkeypatch):
+    # Changing the environment after import must not move calls to another backend
+    monkeypatch.delenv('SUPABASE_URL')
+    supabase_memories.responses.append(FakeResponse({'id': 'm1', 'content': 'kept', 'data_protection_level': 'standard'}))
+
+    assert memories_db.get_memory('uid-1', 'm1')['content'] == 'kept'
+
+
+def test_supabase_backend_skips_the_firestore_sdk():
+    assert not hasattr(memories_db, 'firestore')
+    assert not hasattr(memories_db, 'FieldFilter')
@@ -0,0 +1,92 @@
+import asyncio
+from datetime import datetime
+
+import httpx
+import pytest
+from postgrest.types import CountMethod
+
+from database import supabase_client
+
+
+class FlakyQuery:
+    """Raises the given errors in turn, then returns 'ok'"""
+
+    def __init__(self, *errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def execute(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return 'ok'
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(supabase_client.time, 'sleep', lambda seconds: None)
+
+
+def test_write_is_not_retried_once_the_request_may_have_been_sent():
+    query = FlakyQuery(httpx.RemoteProtocolError('server disconnected'))
+
+    with pytest.raises(httpx.RemoteProtocolError):
+        supabase_client.execute_with_reconnect(query)
+    assert query.calls == 1
+
+
+def test_write_is_retried_when_the_request_was_never_sent():
+    query = FlakyQuery(httpx.ConnectError('refused'), httpx.PoolTimeout('pool exhausted'))
+
+    assert supabase_client.execute_with_reconnect(query) == 'ok'
+    assert query.calls == 3
+
+
+def test_idempotent_query_is_retried_after_a_dropped_connection():
+    query = FlakyQuery(httpx.RemoteProtocolError('server disconnected'))
+
+    assert supabase_client.execute_with_reconnect(query, idempotent=True) == 'ok'
+    assert query.calls == 2
+
+
+def test_no_blocking_retries_on_the_event_loop():
+    query = FlakyQuery(httpx.ConnectError('refused'))
+
+    async def run():
+        return supabase_client.execute_with_reconnect(query, idempotent=True)
+
+    with pytest.raises(httpx.ConnectError):
+        asyncio.run(run())
+    assert query.calls == 1
+
+
+def test_client_creation_fails_without_the_orjson_session(monkeypatch):
+    def broken(client):
+        raise AttributeError('postgrest session moved')
+
+    monkeypatch.setattr(supabase_client, '_pool_postgrest_session', broken)
+
+    with pytest.raises(AttributeError):
+        supabase_client.get_supabase_client()
+
+
+def test_postgrest_session_encodes_datetimes():
+    sent = []
+    session = supabase_client._OrjsonSyncClient(
+        base_url='https://placeholder.supabase.co/rest/v1',
+        transport=httpx.MockTransport(lambda request: sent.append(request) or httpx.Response(201)),
+    )
+
+    session.request('POST', '/memories', json={'created_at': datetime(2024, 5, 1, 12, 30)})
+
+    assert sent[0].content == b'{"created_at":"2024-05-01T12:30:00Z"}'
+    assert sent[0].headers['content-type'] == 'application/json'
+
+
+def test_returning_ids_narrows_a_write_to_the_id_column():
+    # Guards the one place that sets the select parameter on postgrest's builder against library upgrades
+    query = supabase_client.get_supabase().table('memories').delete(count=CountMethod.exact).eq('uid', 'uid-1')
+
+    assert supabase_client.returning_ids(query) is query
+    assert query.params.get('select') == 'id'
+    assert query.params.get('uid') == 'eq.uid-1'
@@ -0,0 +1,33 @@
+import pytest
+from langchain_core.runnables import RunnableLambda
+
+from utils.llm import conversation_processing
+
+
+@pytest.fixture
+def discard_llm(monkeypatch):
+    """Replaces llm_mini with a fake that always answers 'keep'; returns the prompts it was sent"""
+    prompts = []
+
+    def answer(prompt):
+        prompts.append(prompt.to_string())
+        return '{"discard": false}'
+
+    monkeypatch.setattr(conversation_processing, 'llm_mini', RunnableLambda(answer))
+    conversation_processing._discard_cache.clear()
+    return prompts
+
+
+@pytest.mark.parametrize(
+    'transcript',
+    [
+        # get_transcript() labels every segment, so even a filler-only conversation has several distinct words
+        'Speaker 0: uh',
+        # Unspaced CJK is a single \w+ run but a full sentence ("meeting tomorrow at 3pm to discuss progress")
+        '我们明天下午三点开会讨论项目进度',
+    ],
+)
+def test_short_transcripts_are_decided_by_the_llm(discard_llm, transcript):
+    assert conversation_processing.should_discard_conversation(transcript) is False
+    assert len(discard_llm) == 1
+    assert transcript in discard_llm[0]
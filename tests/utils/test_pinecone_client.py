@@ -0,0 +1,53 @@
+import asyncio
+import threading
+
+from utils import pinecone_client as pinecone_module
+
+
+class FlakyPinecone:
+    """Pinecone stand-in whose first connection attempt fails"""
+
+    attempts = 0
+
+    def __init__(self, api_key):
+        type(self).attempts += 1
+        if type(self).attempts == 1:
+            raise ConnectionError('pinecone unreachable')
+
+    def list_indexes(self):
+        return [type('IndexModel', (), {'name': 'taya-memories'})()]
+
+    def Index(self, name):
+        return f'index:{name}'
+
+
+def _client(monkeypatch):
+    monkeypatch.setenv('PINECONE_API_KEY', 'pc-test')
+    monkeypatch.setattr(FlakyPinecone, 'attempts', 0)
+    monkeypatch.setattr(pinecone_module, 'Pinecone', FlakyPinecone)
+    return pinecone_module.PineconeClient()
+
+
+def test_failed_connection_is_retried_on_next_access(monkeypatch):
+    client = _client(monkeypatch)
+
+    assert client.is_available() is False
+    assert client.is_available() is True
+    assert client.index == 'index:taya-memories'
+    assert FlakyPinecone.attempts == 2
+
+
+def test_async_availability_connects_off_the_event_loop(monkeypatch):
+    client = _client(monkeypatch)
+    FlakyPinecone.attempts = 1
+    connect_threads = []
+    connect = client._connect
+    monkeypatch.setattr(client, '_connect', lambda: connect_threads.append(threading.get_ident()) or connect())
+
+    async def check():
+        return await client.is_available_async(), threading.get_ident()
+
+    available, loop_thread = asyncio.run(check())
+
+    assert available is True
+    assert connect_threads and connect_threads[0] != loop_thread
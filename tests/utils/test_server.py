@@ -0,0 +1,36 @@
+import uvicorn
+
+from utils.other import server
+
+
+def _run(monkeypatch, workers):
+    calls = []
+    monkeypatch.setenv('WEB_CONCURRENCY', str(workers))
+    monkeypatch.setattr(uvicorn, 'run', lambda target, **kwargs: calls.append((target, kwargs)))
+    app = object()
+    server.serve(app, 'entry:app', access_log=False)
+    (call,) = calls
+    return app, call
+
+
+def test_single_worker_serves_the_imported_app(monkeypatch):
+    app, (target, kwargs) = _run(monkeypatch, 1)
+
+    # Passing the import string would make uvicorn import the entrypoint module a second time
+    assert target is app
+    assert kwargs['workers'] == 1
+    assert kwargs['access_log'] is False
+
+
+def test_multiple_workers_need_the_import_string(monkeypatch):
+    _, (target, kwargs) = _run(monkeypatch, 4)
+
+    assert target == 'entry:app'
+    assert kwargs['workers'] == 4
+
+
+def test_falls_back_when_the_native_loop_and_parser_are_missing(monkeypatch):
+    monkeypatch.setattr(server, 'find_spec', lambda name: None)
+    _, (_, kwargs) = _run(monkeypatch, 1)
+
+    assert (kwargs['loop'], kwargs['http']) == ('asyncio', 'h11')
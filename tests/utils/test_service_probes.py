@@ -0,0 +1,42 @@
+import asyncio
+
+import pytest
+
+from utils.other import service_probes
+
+
+@pytest.fixture
+def services(monkeypatch):
+    pings = []
+
+    async def pinecone_available():
+        return True
+
+    def ping():
+        pings.append(1)
+        return True
+
+    def stats():
+        raise RuntimeError('index unreachable')
+
+    monkeypatch.setattr(service_probes.redis_client, 'is_available', lambda: True)
+    monkeypatch.setattr(service_probes.redis_client, 'ping', ping)
+    monkeypatch.setattr(service_probes.pinecone_client, 'is_available_async', pinecone_available)
+    monkeypatch.setattr(service_probes.pinecone_client, 'get_stats', stats)
+    service_probes._probes_cache.clear()
+    yield pings
+    service_probes._probes_cache.clear()
+
+
+def test_probe_failures_are_reported_not_raised(services):
+    probes = asyncio.run(service_probes.probe_services())
+
+    assert probes.redis_ping is True
+    assert isinstance(probes.pinecone_stats, RuntimeError)
+
+
+def test_endpoints_share_one_round_of_probes_per_ttl(services):
+    asyncio.run(service_probes.probe_services())
+    asyncio.run(service_probes.probe_services())
+
+    assert services == [1]
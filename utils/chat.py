@@ -34,7 +34,7 @@ def transcribe_voice_message_segment(path: str):
         print('failed to get fal segments')
         return None
 
-    text = " ".join([segment.text for segment in transcript_segments]).strip()
+    text = " ".join(segment.text for segment in transcript_segments if segment.text).strip()
     if len(text) == 0:
         print('voice message text is empty')
         return None
@@ -57,7 +57,7 @@ def process_voice_message_segment(path: str, uid: str):
         print('failed to get fal segments')
         return []
 
-    text = " ".join([segment.text for segment in transcript_segments]).strip()
+    text = " ".join(segment.text for segment in transcript_segments if segment.text).strip()
     if len(text) == 0:
         print('voice message text is empty')
         return []
@@ -124,7 +124,7 @@ async def process_voice_message_segment_stream(path: str, uid: str) -> AsyncGene
         print('failed to get fal segments')
         return
 
-    text = " ".join([segment.text for segment in transcript_segments]).strip()
+    text = " ".join(segment.text for segment in transcript_segments if segment.text).strip()
     if len(text) == 0:
         print('voice message text is empty')
         return
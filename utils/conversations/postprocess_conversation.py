@@ -75,8 +75,8 @@ def postprocess_conversation(
         fal_segments = fal_postprocessing(words, aseg.duration_seconds)
 
         # if new transcript is 90% shorter than the original, cancel post-processing, smth wrong with audio or FAL
-        count = len(''.join([segment.text.strip() for segment in conversation.transcript_segments]))
-        new_count = len(''.join([segment.text.strip() for segment in fal_segments]))
+        count = sum(len(segment.text.strip()) for segment in conversation.transcript_segments)
+        new_count = sum(len(segment.text.strip()) for segment in fal_segments)
         print('Prev characters count:', count, 'New characters count:', new_count)
 
         fal_failed = not fal_segments or new_count < (count * 0.85)
@@ -1,5 +1,7 @@
 import base64
 import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
 
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
@@ -12,6 +14,10 @@ if not ENCRYPTION_SECRET or len(ENCRYPTION_SECRET) < 32:
         "ENCRYPTION_SECRET environment variable not set or is too short. " "It must be a securely managed 32-byte key."
     )
 
+# Below this many values the thread pool costs more than it saves
+_PARALLEL_ENCRYPT_MIN_BATCH = 64
+_ENCRYPT_WORKERS = min(8, os.cpu_count() or 1)
+
 
 def derive_key(uid: str) -> bytes:
     """
@@ -34,7 +40,23 @@ def encrypt(data: str, uid: str) -> str:
     if not data:
         return data
     key = derive_key(uid)
-    aesgcm = AESGCM(key)
+    return _encrypt_with(AESGCM(key), data)
+
+
+def encrypt_many(values: List[str], uid: str) -> List[str]:
+    """
+    Encrypts several strings for the same user, deriving the user's key only once.
+    Large batches are spread over a thread pool, since AES-GCM releases the GIL while it runs.
+    """
+    aesgcm = AESGCM(derive_key(uid))
+    if len(values) < _PARALLEL_ENCRYPT_MIN_BATCH or _ENCRYPT_WORKERS == 1:
+        return [_encrypt_with(aesgcm, value) if value else value for value in values]
+
+    with ThreadPoolExecutor(max_workers=_ENCRYPT_WORKERS) as executor:
+        return list(executor.map(lambda value: _encrypt_with(aesgcm, value) if value else value, values))
+
+
+def _encrypt_with(aesgcm: AESGCM, data: str) -> str:
     nonce = os.urandom(12)  # GCM standard nonce size
 
     # Data must be bytes
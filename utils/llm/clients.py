@@ -1,6 +1,11 @@
+import functools
+import hashlib
 import os
+import threading
 from typing import List
 
+from cachetools import LRUCache, TTLCache
+
 from langchain_core.output_parsers import PydanticOutputParser
 from langchain_core.caches import BaseCache  # ensure forward ref exists
 try:
@@ -26,10 +31,25 @@ import tiktoken
 from models.conversation import Structured
 
 
+# Memoized on the configuration, so every caller asking for the same model settings shares one client
+@functools.cache
 def _make_llm(**kwargs):
     # Avoid model initialization failures during import time; let errors surface at first use
     return ChatOpenAI(**kwargs)
 
+
+@functools.cache
+def _make_openrouter_llm(model: str):
+    return ChatOpenAI(
+        temperature=0.8,
+        model=model,
+        api_key=os.environ.get('OPENROUTER_API_KEY'),
+        base_url="https://openrouter.ai/api/v1",
+        default_headers={"X-Title": "Omi Chat"},
+        streaming=True,
+    )
+
+
 llm_mini = _make_llm(model='gpt-4o-mini')
 llm_mini_stream = _make_llm(model='gpt-4o-mini', streaming=True)
 llm_large = _make_llm(model='o1-preview')
@@ -39,33 +59,54 @@ llm_high_stream = _make_llm(model='o4-mini', streaming=True, temperature=1)
 llm_medium = _make_llm(model='gpt-4o')
 llm_medium_experiment = _make_llm(model='gpt-4.1')
 llm_medium_stream = _make_llm(model='gpt-4o', streaming=True)
-llm_persona_mini_stream = ChatOpenAI(
-    temperature=0.8,
-    model="google/gemini-flash-1.5-8b",
-    api_key=os.environ.get('OPENROUTER_API_KEY'),
-    base_url="https://openrouter.ai/api/v1",
-    default_headers={"X-Title": "Omi Chat"},
-    streaming=True,
-)
-llm_persona_medium_stream = ChatOpenAI(
-    temperature=0.8,
-    model="anthropic/claude-3.5-sonnet",
-    api_key=os.environ.get('OPENROUTER_API_KEY'),
-    base_url="https://openrouter.ai/api/v1",
-    default_headers={"X-Title": "Omi Chat"},
-    streaming=True,
-)
+llm_persona_mini_stream = _make_openrouter_llm("google/gemini-flash-1.5-8b")
+llm_persona_medium_stream = _make_openrouter_llm("anthropic/claude-3.5-sonnet")
 embeddings = OpenAIEmbeddings(model="text-embedding-3-large")
 parser = PydanticOutputParser(pydantic_object=Structured)
 
-encoding = tiktoken.encoding_for_model('gpt-4')
+
+@functools.cache
+def _encoding() -> tiktoken.Encoding:
+    # Loading the BPE ranks is the slowest part of importing this module; defer it to the first token count
+    return tiktoken.encoding_for_model('gpt-4')
+
+
+# Keyed by content digest so long transcripts aren't held as keys. Token counts never change; embeddings
+# expire after an hour so a model switch doesn't keep serving stale vectors for long.
+_token_count_cache = LRUCache(maxsize=4096)
+_token_count_cache_lock = threading.Lock()
+_embedding_cache = TTLCache(maxsize=2048, ttl=3600)
+_embedding_cache_lock = threading.Lock()
+
+
+def _content_key(content: str) -> str:
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
 
 
 def num_tokens_from_string(string: str) -> int:
     """Returns the number of tokens in a text string."""
-    num_tokens = len(encoding.encode(string))
+    cache_key = _content_key(string)
+    with _token_count_cache_lock:
+        num_tokens = _token_count_cache.get(cache_key)
+    if num_tokens is None:
+        num_tokens = len(_encoding().encode(string))
+        with _token_count_cache_lock:
+            _token_count_cache[cache_key] = num_tokens
     return num_tokens
 
 
 def generate_embedding(content: str) -> List[float]:
-    return embeddings.embed_documents([content])[0]
+    cache_key = _content_key(content)
+    with _embedding_cache_lock:
+        vector = _embedding_cache.get(cache_key)
+    if vector is None:
+        vector = generate_embeddings([content])[0]
+        with _embedding_cache_lock:
+            _embedding_cache[cache_key] = vector
+    # Callers get their own list so one of them mutating it can't corrupt the cached vector
+    return list(vector)
+
+
+def generate_embeddings(contents: List[str]) -> List[List[float]]:
+    """Embeds several texts with as few OpenAI requests as the embeddings client's chunk size allows."""
+    return embeddings.embed_documents(contents)
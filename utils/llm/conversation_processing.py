@@ -1,6 +1,9 @@
+import hashlib
+import threading
 from datetime import datetime, timezone
 from typing import List, Optional, Tuple
 
+from cachetools import LRUCache
 from langchain_core.output_parsers import PydanticOutputParser
 from langchain_core.prompts import ChatPromptTemplate
 from pydantic import BaseModel, Field
@@ -18,6 +21,23 @@ class SpeakerIdMatch(BaseModel):
     speaker_id: int = Field(description="The speaker id assigned to the segment")
 
 
+# Structured results keyed by the normalized transcript and the prompt inputs, so client retries and
+# repeated transcripts skip the LLM round-trip.
+_transcript_structure_cache = LRUCache(maxsize=1024)
+_transcript_structure_cache_lock = threading.Lock()
+
+
+def _transcript_structure_cache_key(transcript: str, started_at: datetime, language_code: str, tz: str) -> str:
+    normalized = ' '.join(transcript.lower().split())
+    seed = f'{normalized}|{started_at.isoformat()}|{language_code}|{tz}'
+    return hashlib.sha256(seed.encode('utf-8')).hexdigest()
+
+
+# Discard decisions keyed by the exact content sent to the LLM, for the same retry/replay traffic as above.
+_discard_cache = LRUCache(maxsize=1024)
+_discard_cache_lock = threading.Lock()
+
+
 def should_discard_conversation(transcript: str, photos: List[ConversationPhoto] = None) -> bool:
     # If there's a long transcript, it's very unlikely we want to discard it.
     # This is a performance optimization to avoid unnecessary LLM calls.
@@ -38,6 +58,11 @@ def should_discard_conversation(transcript: str, photos: List[ConversationPhoto]
         return True
 
     full_context = "\n\n".join(context_parts)
+    cache_key = hashlib.sha256(full_context.encode('utf-8')).hexdigest()
+    with _discard_cache_lock:
+        cached = _discard_cache.get(cache_key)
+    if cached is not None:
+        return cached
 
     custom_parser = PydanticOutputParser(pydantic_object=DiscardConversation)
     prompt = ChatPromptTemplate.from_messages(
@@ -76,6 +101,8 @@ Content:
                 'format_instructions': custom_parser.get_format_instructions(),
             }
         )
+        with _discard_cache_lock:
+            _discard_cache[cache_key] = response.discard
         return response.discard
 
     except Exception as e:
@@ -98,6 +125,15 @@ def get_transcript_structure(
     if not context_parts:
         return Structured()  # Should be caught by discard logic, but as a safeguard.
 
+    # Photo descriptions are not part of the key, so only transcript-only requests are cached.
+    cache_key = None
+    if not photos:
+        cache_key = _transcript_structure_cache_key(transcript, started_at, language_code, tz)
+        with _transcript_structure_cache_lock:
+            cached = _transcript_structure_cache.get(cache_key)
+        if cached is not None:
+            return cached.model_copy(deep=True)
+
     full_context = "\n\n".join(context_parts)
 
     prompt_text = '''You are an expert content analyzer. Your task is to analyze the provided content (which could be a transcript, a series of photo descriptions from a wearable camera, or both) and provide structure and clarity.
@@ -181,6 +217,10 @@ def get_transcript_structure(
         if action_item.created_at is None:
             action_item.created_at = datetime.now(timezone.utc)
 
+    if cache_key is not None:
+        with _transcript_structure_cache_lock:
+            _transcript_structure_cache[cache_key] = response.model_copy(deep=True)
+
     return response
 
 
@@ -154,10 +154,10 @@ def new_learnings_extractor(
         return []
 
 
-def identify_category_for_memory(memory: str, categories: List) -> str:
+def _category_for_memory_prompt(memory: str, categories: List) -> str:
     # TODO: this should be structured output!!
     categories_str = ', '.join(categories)
-    prompt = f"""
+    return f"""
     You are an AI tasked with identifying the category of a fact from a list of predefined categories. 
 
     Your task is to determine the most relevant category for the given fact. 
@@ -168,5 +168,13 @@ def identify_category_for_memory(memory: str, categories: List) -> str:
 
     Fact: {memory}
     """
-    response = llm_mini.invoke(prompt)
+
+
+def identify_category_for_memory(memory: str, categories: List) -> str:
+    response = llm_mini.invoke(_category_for_memory_prompt(memory, categories))
+    return response.content
+
+
+async def identify_category_for_memory_async(memory: str, categories: List) -> str:
+    response = await llm_mini.ainvoke(_category_for_memory_prompt(memory, categories))
     return response.content
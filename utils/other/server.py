@@ -0,0 +1,23 @@
+import os
+from importlib.util import find_spec
+
+
+def serve(app, import_string: str, port: int = None, **kwargs):
+    """Runs an entrypoint's app under uvicorn with the settings every entrypoint shares.
+
+    uvloop and httptools have no Windows builds, so the pure-Python loop and parser are used when they are missing.
+    Worker processes import the app by name; a single process serves the already-imported app instead of importing
+    its module a second time.
+    """
+    import uvicorn
+
+    workers = int(os.environ.get("WEB_CONCURRENCY", 1))
+    uvicorn.run(
+        import_string if workers > 1 else app,
+        host="0.0.0.0",
+        port=port or int(os.environ.get("PORT", 8080)),
+        loop="uvloop" if find_spec("uvloop") else "asyncio",
+        http="httptools" if find_spec("httptools") else "h11",
+        workers=workers,
+        **kwargs,
+    )
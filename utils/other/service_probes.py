@@ -0,0 +1,49 @@
+import asyncio
+from typing import Any, NamedTuple
+
+from cachetools import TTLCache
+
+from utils.pinecone_client import pinecone_client
+from utils.redis_client import redis_client
+
+
+class ServiceProbes(NamedTuple):
+    """Raw probe results; a probe is None when its service isn't configured, or the exception it raised"""
+
+    redis_available: bool
+    redis_ping: Any
+    pinecone_available: bool
+    pinecone_stats: Any
+
+
+# Load balancers, dashboards and tunnel monitors poll the health endpoints constantly; every endpoint shares one
+# round of probes per TTL
+_probes_cache = TTLCache(maxsize=1, ttl=3)
+
+
+async def _probe(available: bool, fn):
+    """Run a blocking service probe in a worker thread; None when the service isn't configured"""
+    if not available:
+        return None
+    return await asyncio.to_thread(fn)
+
+
+async def _probe_services() -> ServiceProbes:
+    redis_available = redis_client.is_available()
+    pinecone_available = await pinecone_client.is_available_async()
+
+    # Both probes are network calls, so run them concurrently
+    redis_ping, pinecone_stats = await asyncio.gather(
+        _probe(redis_available, redis_client.ping),
+        _probe(pinecone_available, pinecone_client.get_stats),
+        return_exceptions=True,
+    )
+    return ServiceProbes(redis_available, redis_ping, pinecone_available, pinecone_stats)
+
+
+async def probe_services() -> ServiceProbes:
+    """Ping Redis and fetch Pinecone stats, reusing the last results for a few seconds"""
+    probes = _probes_cache.get('probes')
+    if probes is None:
+        probes = _probes_cache['probes'] = await _probe_services()
+    return probes
@@ -1,41 +1,92 @@
+import asyncio
 import os
+import threading
 from typing import List, Dict, Any, Optional, Tuple
+from cachetools import TTLCache
 from pinecone import Pinecone
 import uuid
 
+# Pinecone recommends at most 100 vectors per upsert request and accepts up to 1000 IDs per delete
+_UPSERT_BATCH_SIZE = 100
+_DELETE_BATCH_SIZE = 1000
+
+# Health and test endpoints poll the index stats; vector counts don't need to be fresher than this
+_stats_cache = TTLCache(maxsize=1, ttl=30)
+_stats_lock = threading.Lock()
+
+
+def _memory_vector(memory_id: str,
+                   embedding: List[float],
+                   text: str,
+                   user_id: str,
+                   metadata: Optional[Dict] = None) -> Dict[str, Any]:
+    memory_metadata = {
+        "text": text,
+        "user_id": user_id,
+        "type": "memory"
+    }
+
+    if metadata:
+        memory_metadata.update(metadata)
+
+    return {
+        "id": memory_id,
+        "values": embedding,
+        "metadata": memory_metadata
+    }
+
 class PineconeClient:
     def __init__(self):
         self.api_key = os.getenv("PINECONE_API_KEY")
         self.index_name = os.getenv("PINECONE_INDEX_NAME", "taya-memories")
+        self.pc = None
+        self._index = None
+        self._index_lock = threading.Lock()
 
         if not self.api_key:
             print("Warning: Pinecone API key not found. Vector search features disabled.")
+
+    @property
+    def index(self):
+        """
+        Connects on first use, so importing this module doesn't call the Pinecone API
+        Only a successful connection is kept; after a failure the next access tries again
+        """
+        if self._index is None and self.api_key:
+            with self._index_lock:
+                if self._index is None:
+                    self._index = self._connect()
+        return self._index
+
+    def _connect(self):
+        try:
+            self.pc = Pinecone(api_key=self.api_key)
+
+            # Check if index exists
+            existing_indexes = [idx.name for idx in self.pc.list_indexes()]
+
+            if self.index_name not in existing_indexes:
+                print(f"Pinecone index '{self.index_name}' not found. Please create it manually in the Pinecone console.")
+                print(f"Index configuration: dimension=1536, metric=cosine")
+                return None
+
+            index = self.pc.Index(self.index_name)
+            print(f"Connected to Pinecone index: {self.index_name}")
+            return index
+
+        except Exception as e:
+            print(f"Pinecone initialization error: {e}")
             self.pc = None
-            self.index = None
-        else:
-            try:
-                self.pc = Pinecone(api_key=self.api_key)
-
-                # Check if index exists
-                existing_indexes = [idx.name for idx in self.pc.list_indexes()]
-
-                if self.index_name not in existing_indexes:
-                    print(f"Pinecone index '{self.index_name}' not found. Please create it manually in the Pinecone console.")
-                    print(f"Index configuration: dimension=1536, metric=cosine")
-                    self.index = None
-                else:
-                    self.index = self.pc.Index(self.index_name)
-                    print(f"Connected to Pinecone index: {self.index_name}")
-
-            except Exception as e:
-                print(f"Pinecone initialization error: {e}")
-                self.pc = None
-                self.index = None
+            return None
 
     def is_available(self) -> bool:
         """Check if Pinecone is available and configured"""
         return self.index is not None
 
+    async def is_available_async(self) -> bool:
+        """is_available for async code; connecting to the index is blocking network I/O"""
+        return await asyncio.to_thread(self.is_available)
+
     def upsert_vectors(self, vectors: List[Dict[str, Any]]) -> bool:
         """
         Upsert vectors to Pinecone
@@ -45,12 +96,27 @@ class PineconeClient:
             return False
 
         try:
-            self.index.upsert(vectors=vectors)
+            for i in range(0, len(vectors), _UPSERT_BATCH_SIZE):
+                self.index.upsert(vectors=vectors[i:i + _UPSERT_BATCH_SIZE])
             return True
         except Exception as e:
             print(f"Pinecone upsert error: {e}")
             return False
 
+    async def upsert_vectors_async(self, vectors: List[Dict[str, Any]]) -> bool:
+        """
+        Upsert vectors without blocking the event loop
+        Each batch of up to 100 vectors is sent from a worker thread, all batches concurrently
+        """
+        if not await self.is_available_async():
+            return False
+
+        results = await asyncio.gather(*(
+            asyncio.to_thread(self.upsert_vectors, vectors[i:i + _UPSERT_BATCH_SIZE])
+            for i in range(0, len(vectors), _UPSERT_BATCH_SIZE)
+        ))
+        return all(results)
+
     def query_vectors(self,
                      query_vector: List[float],
                      top_k: int = 10,
@@ -83,29 +149,51 @@ class PineconeClient:
             print(f"Pinecone query error: {e}")
             return []
 
+    def fetch_vectors(self, ids: List[str]) -> Dict[str, Any]:
+        """Fetch vectors by IDs; returns a mapping of the IDs that were found"""
+        if not self.is_available():
+            return {}
+
+        try:
+            return dict(self.index.fetch(ids=ids).vectors)
+        except Exception as e:
+            print(f"Pinecone fetch error: {e}")
+            return {}
+
     def delete_vectors(self, ids: List[str]) -> bool:
         """Delete vectors by IDs"""
         if not self.is_available():
             return False
 
         try:
-            self.index.delete(ids=ids)
+            for i in range(0, len(ids), _DELETE_BATCH_SIZE):
+                self.index.delete(ids=ids[i:i + _DELETE_BATCH_SIZE])
             return True
         except Exception as e:
             print(f"Pinecone delete error: {e}")
             return False
 
     def get_stats(self) -> Optional[Dict[str, Any]]:
-        """Get index statistics"""
+        """Get index statistics, cached for 30 seconds"""
         if not self.is_available():
             return None
 
+        with _stats_lock:
+            stats = _stats_cache.get(self.index_name)
+        if stats is not None:
+            return stats
+
         try:
-            return self.index.describe_index_stats()
+            stats = self.index.describe_index_stats()
         except Exception as e:
             print(f"Pinecone stats error: {e}")
             return None
 
+        # Only successful responses are cached, so a failed call is retried on the next poll
+        with _stats_lock:
+            _stats_cache[self.index_name] = stats
+        return stats
+
     def upsert_memory(self,
                      memory_id: str,
                      embedding: List[float],
@@ -116,22 +204,18 @@ class PineconeClient:
         Upsert a memory with embedding
         Convenience method for memory-specific operations
         """
-        memory_metadata = {
-            "text": text,
-            "user_id": user_id,
-            "type": "memory"
-        }
-
-        if metadata:
-            memory_metadata.update(metadata)
-
-        vector = {
-            "id": memory_id,
-            "values": embedding,
-            "metadata": memory_metadata
-        }
-
-        return self.upsert_vectors([vector])
+        return self.upsert_vectors([_memory_vector(memory_id, embedding, text, user_id, metadata)])
+
+    def upsert_memories(self, memories: List[Dict[str, Any]]) -> bool:
+        """
+        Upsert several memories, sending up to 100 vectors per request
+        memories format: [{"id": ..., "embedding": [...], "text": ..., "user_id": ..., "metadata": {...}}]
+        """
+        vectors = [
+            _memory_vector(m["id"], m["embedding"], m["text"], m["user_id"], m.get("metadata"))
+            for m in memories
+        ]
+        return self.upsert_vectors(vectors)
 
     def search_memories(self,
                        query_embedding: List[float],
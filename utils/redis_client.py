@@ -1,8 +1,26 @@
 import os
 from typing import Optional, Any
-import json
+import orjson
 from upstash_redis import Redis
 
+def _serialize(value: Any) -> str:
+    """Strings are stored as-is, anything else as JSON; non-string dict keys are stringified like json.dumps did"""
+    if isinstance(value, str):
+        return value
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+# First characters a JSON document can start with; anything else is a plain string stored by _serialize
+_JSON_START = frozenset('{["-0123456789tfn')
+
+def _deserialize(value: str) -> Any:
+    """Parse JSON values back, fallback to string; plain strings are recognised without a failed parse"""
+    if not value or value[0] not in _JSON_START:
+        return value
+    try:
+        return orjson.loads(value)
+    except orjson.JSONDecodeError:
+        return value
+
 class RedisClient:
     def __init__(self):
         self.redis_url = os.getenv("UPSTASH_REDIS_REST_URL")
@@ -24,7 +42,7 @@ class RedisClient:
             return False
 
         try:
-            serialized_value = json.dumps(value) if not isinstance(value, str) else value
+            serialized_value = _serialize(value)
             if expire:
                 return self.client.setex(key, expire, serialized_value)
             else:
@@ -42,16 +60,25 @@ class RedisClient:
             value = self.client.get(key)
             if value is None:
                 return None
-
-            # Try to parse as JSON, fallback to string
-            try:
-                return json.loads(value)
-            except json.JSONDecodeError:
-                return value
+            return _deserialize(value)
         except Exception as e:
             print(f"Redis GET error: {e}")
             return None
 
+    def getdel(self, key: str) -> Optional[Any]:
+        """Get a value and delete its key in a single round trip"""
+        if not self.is_available():
+            return None
+
+        try:
+            value = self.client.getdel(key)
+            if value is None:
+                return None
+            return _deserialize(value)
+        except Exception as e:
+            print(f"Redis GETDEL error: {e}")
+            return None
+
     def delete(self, key: str) -> bool:
         """Delete a key"""
         if not self.is_available():
@@ -1,4 +1,5 @@
 import asyncio
+import functools
 import os
 import random
 import time
@@ -6,8 +7,6 @@ from typing import List
 from enum import Enum
 
 import websockets
-from deepgram import DeepgramClient, DeepgramClientOptions, LiveTranscriptionEvents
-from deepgram.clients.live.v1 import LiveOptions
 
 from utils.stt.soniox_util import *
 
@@ -232,26 +231,23 @@ async def send_initial_file(data: List[List[int]], transcript_socket):
     print('send_initial_file', time.time() - start)
 
 
-# Initialize Deepgram client based on environment configuration
+# Deepgram configuration is validated at import, but the SDK and client are only loaded on first connection
 is_dg_self_hosted = os.getenv('DEEPGRAM_SELF_HOSTED_ENABLED', '').lower() == 'true'
-deepgram_options = DeepgramClientOptions(options={"keepalive": "true", "termination_exception_connect": "true"})
+dg_self_hosted_url = os.getenv('DEEPGRAM_SELF_HOSTED_URL')
+if is_dg_self_hosted and not dg_self_hosted_url:
+    raise ValueError("DEEPGRAM_SELF_HOSTED_URL must be set when DEEPGRAM_SELF_HOSTED_ENABLED is true")
 
-deepgram_beta_options = DeepgramClientOptions(options={"keepalive": "true", "termination_exception_connect": "true"})
-deepgram_beta_options.url = "https://api.beta.deepgram.com"
 
-if is_dg_self_hosted:
-    dg_self_hosted_url = os.getenv('DEEPGRAM_SELF_HOSTED_URL')
-    if not dg_self_hosted_url:
-        raise ValueError("DEEPGRAM_SELF_HOSTED_URL must be set when DEEPGRAM_SELF_HOSTED_ENABLED is true")
-    # Override only the URL while keeping all other options
-    deepgram_options.url = dg_self_hosted_url
-    deepgram_beta_options.url = dg_self_hosted_url
-    print(f"Using Deepgram self-hosted at: {dg_self_hosted_url}")
+@functools.cache
+def _deepgram_client():
+    from deepgram import DeepgramClient, DeepgramClientOptions
 
-deepgram = DeepgramClient(os.getenv('DEEPGRAM_API_KEY'), deepgram_options)
-
-# unused fn
-deepgram_beta = DeepgramClient(os.getenv('DEEPGRAM_API_KEY'), deepgram_beta_options)
+    deepgram_options = DeepgramClientOptions(options={"keepalive": "true", "termination_exception_connect": "true"})
+    if is_dg_self_hosted:
+        # Override only the URL while keeping all other options
+        deepgram_options.url = dg_self_hosted_url
+        print(f"Using Deepgram self-hosted at: {dg_self_hosted_url}")
+    return DeepgramClient(os.getenv('DEEPGRAM_API_KEY'), deepgram_options)
 
 
 async def process_audio_dg(
@@ -341,8 +337,11 @@ def connect_to_deepgram_with_backoff(
 
 
 def connect_to_deepgram(on_message, on_error, language: str, sample_rate: int, channels: int, model: str):
+    from deepgram import LiveTranscriptionEvents
+    from deepgram.clients.live.v1 import LiveOptions
+
     try:
-        dg_connection = deepgram.listen.websocket.v("1")
+        dg_connection = _deepgram_client().listen.websocket.v("1")
         dg_connection.on(LiveTranscriptionEvents.Transcript, on_message)
         dg_connection.on(LiveTranscriptionEvents.Error, on_error)
 